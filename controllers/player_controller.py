@@ -3,11 +3,10 @@ Contrôleur pour gérer les joueurs.
 """
 
 import re
-from datetime import datetime
 from views.display_message import DisplayMessage
 from views.console_view import ConsoleView
 from models.player import Player
-from utils.input_utils import InputUtils, MAX_ATTEMPTS
+from utils.input_utils import InputUtils, MAX_ATTEMPTS, is_valid_date
 
 
 # -----------------------
@@ -39,18 +38,16 @@ class PlayerController:
 
     def _get_sorted_players(self):
         """
-        Retourne une nouvelle liste des joueurs (Player.registry) triée par nom puis prénom.
+        Retourne la liste des joueurs (Player.registry) triée par nom puis prénom.
         Étapes :
         1. Récupère la liste globale des joueurs depuis Player.registry
         2. Trie la liste par nom (last_name) puis par prénom (first_name)
         3. Retourne la liste triée (sans modifier Player.registry)
         """
-        # 1️⃣ Accède à la liste des joueurs enregistrés (Player.registry)
-        # 2️⃣ Utilise sorted() pour générer une liste triée
-        #    - key=lambda p: (p.last_name, p.first_name) : tri alphabétique
-        #      en priorité sur le nom, puis sur le prénom
-        # 3️⃣ Retourne la nouvelle liste triée
-        return sorted(Player.registry, key=lambda p: (p.last_name, p.first_name))
+        # 1️⃣ Délègue à Player.sorted_registry() :
+        #    - tri alphabétique en priorité sur le nom, puis sur le prénom
+        #    - tri mémorisé, refait seulement si le registre a changé
+        return Player.sorted_registry()
 
     # -----------------------
     #   SÉLECTION D'UN JOUEUR
@@ -180,7 +177,7 @@ class PlayerController:
                 continue
 
             # 3️⃣ Vérification que cet identifiant n'existe pas déjà dans le registre
-            if any(p.national_id == national_id for p in Player.registry):
+            if national_id in Player.by_id:
                 DisplayMessage.display_already_exists(attempt, MAX_ATTEMPTS)
                 continue
 
@@ -316,7 +313,7 @@ class PlayerController:
             if not re.match(r"AB\d{5}$", value):
                 DisplayMessage.display_not_re_match(attempt, MAX_ATTEMPTS)
                 continue
-            if any(p.national_id == value and p != player for p in Player.registry):
+            if Player.by_id.get(value, player) is not player:
                 DisplayMessage.display_already_exists(attempt, MAX_ATTEMPTS)
                 continue
             if value != player.national_id:
@@ -342,13 +339,15 @@ class PlayerController:
         # 4️⃣ Date de naissance
         value = input(f"Date de naissance [{player.birth_date}] : ").strip()
         if value:
-            try:
-                datetime.strptime(value, "%d/%m/%Y")
-                if value != player.birth_date:
-                    player.birth_date = value
-                    updated = True
-            except ValueError:
+            if not is_valid_date(value):
                 DisplayMessage.display_error_format_date()
+            elif value != player.birth_date:
+                player.birth_date = value
+                updated = True
+
+        # 5️⃣ Le nom ou le prénom a pu changer : le tri mémorisé n'est plus fiable
+        if updated:
+            Player.registry_changed()
 
         return updated
 
@@ -405,7 +404,11 @@ class PlayerController:
 
         if confirm == "o":
             # 4️⃣ Retire le joueur du registre global
+            #    (et de l'index by_id, seulement si l'entrée est bien la sienne)
             Player.registry.remove(player)
+            if Player.by_id.get(player.national_id) is player:
+                del Player.by_id[player.national_id]
+            Player.registry_changed()
 
             # 5️⃣ Sauvegarde immédiate de la liste mise à jour
             Player.save_all()
@@ -437,9 +440,10 @@ class PlayerController:
         # 2️⃣ Demande le terme de recherche et le met en minuscules
         term = input("Recherche : ").lower().strip()
 
-        # 3️⃣ Parcourt le registre et sélectionne les joueurs correspondant
+        # 3️⃣ Parcourt le registre déjà trié par nom puis prénom (tri mémorisé)
+        #    et sélectionne les joueurs correspondant : les résultats restent triés
         results = []
-        for p in Player.registry:
+        for p in self._get_sorted_players():
             if (
                 term in p.last_name.lower()
                 or term in p.first_name.lower()
@@ -448,11 +452,8 @@ class PlayerController:
             ):
                 results.append(p)
 
-        # 4️⃣ Si des joueurs sont trouvés, on les trie et on les affiche
+        # 4️⃣ Si des joueurs sont trouvés, on les affiche (déjà triés)
         if results:
-            # a) Trie par nom puis prénom
-            results = sorted(results, key=lambda p: (p.last_name, p.first_name))
-            # b) Affiche la liste via la ConsoleView
             ConsoleView.show_players(results)
         else:
             # 5️⃣ Aucun résultat trouvé : affiche un message explicite
@@ -1,13 +1,18 @@
 """Contrôleur principal — partie commune et utilitaires."""
 
 # import csv
+import functools
+import itertools
 import json
+import os
+from contextlib import contextmanager
 
 
 from pathlib import Path
 
 from views.display_message import DisplayMessage
 from views.console_view import ConsoleView
+from models.player import DATA_FILE as PLAYERS_FILE, Player
 from models.tournament import Tournament
 
 
@@ -27,6 +32,10 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 DATA_DIR = BASE_DIR / "data" / "tournaments"
 EXPORT_DIR = BASE_DIR / "export"
 
+# 4️⃣ Compteur global des versions de rendu de la liste des tournois
+#    - Partagé par tous les contrôleurs : deux versions ne se répètent jamais
+RENDER_VERSIONS = itertools.count(1)
+
 
 def create_export_directory():
     """
@@ -41,6 +50,23 @@ def create_export_directory():
         EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def batched_saves(method):
+    """
+    Décorateur : exécute une méthode de contrôleur dans un lot de sauvegardes.
+    Tous les appels à _save() faits pendant la méthode sont regroupés et
+    chaque tournoi concerné n'est écrit qu'une seule fois, à la fin
+    (ou plus tôt via _flush_saves(), avant un message de confirmation).
+    Si la méthode lève une exception, rien n'est écrit.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._batch_saves():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class TournamentControllerBase:
     """
     Contrôleur principal pour la gestion des tournois.
@@ -61,6 +87,38 @@ class TournamentControllerBase:
         # 1️⃣ Crée une liste interne pour stocker les objets Tournament
         self._tournaments = []
 
+        # 🅰 Cache du texte de la liste des tournois ((clé, texte) ou None)
+        #    et version courante, changée à chaque chargement/sauvegarde
+        self._render_cache = None
+        self._render_version = next(RENDER_VERSIONS)
+
+        # 🅱 Dernier tri par nom : (liste source, (liste triée, positions)) ou None
+        self._sorted_cache = None
+
+        # 🅲 Tournois déjà chargés, indexés par nom de fichier, avec l'empreinte
+        #    (mtime, taille) du fichier lu et celle de players.json à ce moment-là
+        self._by_name = {}
+        self._key_by_name = {}
+        self._players_key = None
+
+        # 🅳 Empreinte complète du dossier au dernier chargement et liste complète
+        #    des tournois construite à ce moment-là (None = jamais chargé)
+        self._last_scan = None
+        self._all_tournaments = []
+
+        # 🅴 Tournois en attente d'écriture pendant un lot de sauvegardes
+        #    (None = aucun lot en cours, les sauvegardes sont immédiates)
+        self._pending_saves = None
+
+        # 🅵 Index des tournois par statut : (version de rendu, liste source,
+        #    {statut: [tournois]}) ou None ; reconstruit après chaque changement
+        self._status_index = None
+
+        # 🅶 Index identifiant national → tournois où le joueur est inscrit :
+        #    ((version de rendu, version du registre), liste source,
+        #    {id: [tournois]}) ou None
+        self._player_index = None
+
         # 2️⃣ Charge automatiquement les tournois existants
         #    depuis DATA_DIR via la méthode _load()
         self._load()
@@ -81,6 +139,18 @@ class TournamentControllerBase:
         Retour :
         - L'objet Tournament sélectionné, ou None si annulation ou saisie invalide.
         """
+        # 1️⃣ Délègue à _choose_indexed et ne garde que le tournoi
+        return self._choose_indexed(action, tournament_list)[1]
+
+    # ------- Sélection d'un tournoi avec sa position dans la liste -------
+    def _choose_indexed(self, action, tournament_list=None):
+        """
+        Identique à _choose(), mais retourne aussi la position du tournoi choisi
+        dans la liste d'origine (self._tournaments ou tournament_list).
+
+        Retour :
+        - tuple (position, Tournament), ou (None, None) si annulation ou saisie invalide.
+        """
         # 1️⃣ Utilise la liste fournie ou la liste par défaut
         tournaments = (
             tournament_list if tournament_list is not None else self._tournaments
@@ -89,28 +159,142 @@ class TournamentControllerBase:
         # 2️⃣ Si aucun tournoi n'est disponible, informe l'utilisateur et quitte
         if not tournaments:
             DisplayMessage.display_tournament_not_saved()
-            return None
+            return None, None
 
         # 3️⃣ Affiche la liste des tournois via ConsoleView (triée par nom)
-        tournaments = sorted(tournaments, key=lambda t: t.name.lower())
-        ConsoleView.show_tournaments(tournaments)
+        #    La liste par défaut réutilise le tri mémorisé par _sorted_tournaments()
+        if tournament_list is None:
+            ordered, positions = self._sorted_with_positions()
+        else:
+            ordered, positions = self._sort_by_name(tournaments)
+        self._show_tournaments(ordered)
 
         # 4️⃣ Demande à l'utilisateur de choisir un tournoi
         choice = input(f"\nNuméro du tournoi pour {action} : ").strip()
 
-        # 5️⃣ Vérifie que la saisie est un nombre valide
-        if not choice.isdigit():
+        # 5️⃣ Convertit la saisie en nombre en une seule passe (int lève ValueError sinon)
+        try:
+            idx = int(choice)
+        except ValueError:
             DisplayMessage.display_not_isdigit()
-            return None
+            return None, None
 
-        idx = int(choice)
-        if 1 <= idx <= len(tournaments):
-            # 6️⃣ Retourne le tournoi sélectionné
-            return tournaments[idx - 1]
+        if 1 <= idx <= len(ordered):
+            # 6️⃣ Retourne la position d'origine et le tournoi sélectionné
+            return positions[idx - 1], ordered[idx - 1]
 
         # 7️⃣ Si l'index est hors plage
         DisplayMessage.display_out_of_range()
-        return None
+        return None, None
+
+    # ------- Tri par nom en conservant les positions d'origine -------
+    @staticmethod
+    def _sort_by_name(tournaments):
+        """
+        Trie des tournois par nom (insensible à la casse).
+        Retour :
+        - tuple (liste triée, positions de chaque tournoi trié dans la liste reçue)
+        """
+        # 1️⃣ Décore chaque tournoi avec sa clé de tri et sa position, puis trie
+        decorated = sorted((t.name_key, i) for i, t in enumerate(tournaments))
+
+        # 2️⃣ Retire la décoration
+        positions = [i for _, i in decorated]
+        return [tournaments[i] for i in positions], positions
+
+    # ------- Liste des tournois triée par nom, mémorisée -------
+    def _sorted_with_positions(self):
+        """
+        Retourne self._tournaments trié par nom (voir _sort_by_name()).
+        - Le tri est mémorisé et réutilisé tant que la liste source est la même.
+        - Une nouvelle liste (rechargement, filtrage) invalide le cache d'elle-même ;
+          un ajout, une suppression ou un renommage doit remettre _sorted_cache à None.
+        """
+        # 1️⃣ Cache absent ou construit sur une autre liste : on trie à nouveau
+        if self._sorted_cache is None or self._sorted_cache[0] is not self._tournaments:
+            self._sorted_cache = (self._tournaments, self._sort_by_name(self._tournaments))
+
+        # 2️⃣ Retourne la liste triée mémorisée et les positions d'origine
+        return self._sorted_cache[1]
+
+    # ------- Liste des tournois triée par nom -------
+    def _sorted_tournaments(self):
+        """Retourne self._tournaments trié par nom (tri mémorisé)."""
+        return self._sorted_with_positions()[0]
+
+    # ------- Affichage de la liste des tournois avec cache du rendu -------
+    def _show_tournaments(self, tournaments):
+        """
+        Affiche la liste des tournois en réutilisant le texte déjà construit
+        si rien n'a changé depuis le dernier affichage.
+        Étapes :
+        1. Calcule une empreinte : version courante + identité des tournois affichés
+        2. Reconstruit le texte seulement si l'empreinte a changé
+        3. Affiche le texte en une seule écriture
+        """
+        # 1️⃣ Empreinte de la liste à afficher
+        key = (self._render_version, tuple(map(id, tournaments)))
+
+        # 2️⃣ Reconstruit le texte si le cache est vide ou périmé
+        if self._render_cache is None or self._render_cache[0] != key:
+            self._render_cache = (key, ConsoleView.render_tournaments(tournaments))
+
+        # 3️⃣ Affiche le texte mis en cache
+        print(self._render_cache[1], end="")
+
+    # ------- Tournois ayant un statut donné (index mémorisé) -------
+    def _with_status(self, status):
+        """
+        Retourne les tournois de self._tournaments ayant le statut demandé.
+        - L'index {statut: [tournois]} est construit en une passe puis réutilisé
+          tant que la version de rendu et la liste source n'ont pas changé
+          (tout changement de statut passe par _save(), qui change la version).
+        - La liste retournée est partagée : elle ne doit pas être modifiée.
+        """
+        # 1️⃣ Index absent ou périmé : une seule passe sur les tournois
+        index = self._status_index
+        if (
+            index is None
+            or index[0] != self._render_version
+            or index[1] is not self._tournaments
+        ):
+            by_status = {}
+            for t in self._tournaments:
+                by_status.setdefault(t.status, []).append(t)
+            index = self._status_index = (
+                self._render_version, self._tournaments, by_status
+            )
+
+        # 2️⃣ Lecture directe (liste vide si aucun tournoi n'a ce statut)
+        return index[2].get(status, [])
+
+    # ------- Tournois où un joueur est inscrit (index mémorisé) -------
+    def _tournaments_with_player(self, national_id):
+        """
+        Retourne les tournois de self._tournaments où le joueur est inscrit.
+        - Même principe que _with_status() : index construit en une passe,
+          réutilisé tant que la version de rendu, la version du registre des
+          joueurs (changement d'identifiant) et la liste source n'ont pas
+          changé (toute inscription ou désinscription passe par _save()).
+        - La liste retournée est partagée : elle ne doit pas être modifiée.
+        """
+        # 1️⃣ Index absent ou périmé : une seule passe sur tous les inscrits
+        index = self._player_index
+        version = (self._render_version, Player.registry_version)
+        if index is None or index[0] != version or index[1] is not self._tournaments:
+            by_player = {}
+            for t in self._tournaments:
+                for p in t.players:
+                    by_player.setdefault(p.national_id, []).append(t)
+            index = self._player_index = (version, self._tournaments, by_player)
+
+        # 2️⃣ Lecture directe (liste vide si le joueur n'est inscrit nulle part)
+        return index[2].get(national_id, [])
+
+    # ------- Invalide le cache d'affichage après une modification -------
+    def _mark_dirty(self):
+        """Change la version de rendu pour forcer la reconstruction de la liste."""
+        self._render_version = next(RENDER_VERSIONS)
 
     # -----------------------
     #   CHARGEMENT DES TOURNOIS
@@ -120,26 +304,91 @@ class TournamentControllerBase:
         """
         Charge tous les tournois valides à partir des fichiers JSON présents
         dans le répertoire DATA_DIR (data/tournaments).
+        Seuls les fichiers nouveaux ou modifiés depuis le dernier chargement
+        sont relus ; les autres tournois restent tels quels en mémoire.
         Étapes :
-        1. Vide la liste interne _tournaments
-        2. Vérifie l'existence du dossier de données
-        3. Parcourt les fichiers JSON et tente de charger chaque tournoi
+        1. Relève l'empreinte (mtime, taille) de chaque fichier JSON
+            - Si rien n'a changé depuis le dernier chargement, remet simplement
+              la liste complète en place (caches de tri et d'affichage conservés)
+        2. Si players.json a changé, oublie tous les tournois déjà chargés
+        3. Oublie les tournois dont le fichier a disparu
+        4. Relit les fichiers nouveaux ou modifiés
             - Ignore les fichiers invalides ou corrompus avec un avertissement
+        5. Reconstruit la liste interne _tournaments
         """
-        # 1️⃣ Vide la liste interne des tournois avant de recharger
-        self._tournaments.clear()
-
-        # 2️⃣ Parcourt tous les fichiers JSON présents dans le dossier
-        for file in DATA_DIR.glob("*.json"):
+        # 1️⃣ Empreinte actuelle des fichiers de tournois et de players.json
+        current = self._scan_data_dir()
+        players_key = self._stat_key(PLAYERS_FILE)
+
+        # 🅰 Aucun fichier modifié, ajouté ou supprimé : rien à relire.
+        #    La liste complète est remise en place (elle a pu être filtrée entre-temps)
+        if current == self._last_scan and players_key == self._players_key:
+            self._tournaments = self._all_tournaments
+            return
+
+        # 2️⃣ Les joueurs des tournois viennent de players.json :
+        #    s'il a changé, chaque tournoi doit être reconstruit
+        if players_key != self._players_key:
+            self._by_name.clear()
+            self._key_by_name.clear()
+            self._players_key = players_key
+
+        # 3️⃣ Retire les tournois dont le fichier a été supprimé
+        for name in list(self._by_name):
+            if name not in current:
+                del self._by_name[name]
+                del self._key_by_name[name]
+
+        # 4️⃣ Recharge uniquement les fichiers nouveaux ou modifiés
+        for name, key in current.items():
+            if self._key_by_name.get(name) == key:
+                continue
+            self._by_name.pop(name, None)
+            self._key_by_name.pop(name, None)
             try:
                 # 🅰 Tente de charger le tournoi grâce à Tournament.load()
-                tournament = Tournament.load(file.name)
+                tournament = Tournament.load(name)
             except (ValueError, json.JSONDecodeError):
                 # 🅱 En cas d'erreur (JSON invalide ou autre problème), on ignore le fichier
-                DisplayMessage.display_load_tournament_failed(file.name)
+                DisplayMessage.display_load_tournament_failed(name)
             else:
-                # 🅲 Si le fichier est valide, on ajoute le tournoi dans la liste
-                self._tournaments.append(tournament)
+                # 🅲 Si le fichier est valide, on le garde avec son empreinte
+                self._by_name[name] = tournament
+                self._key_by_name[name] = key
+
+        # 5️⃣ Reconstruit la liste dans l'ordre du dossier
+        self._tournaments = [self._by_name[n] for n in current if n in self._by_name]
+        self._all_tournaments = self._tournaments
+        self._last_scan = current
+        self._mark_dirty()
+
+    # ------- Empreinte des fichiers JSON du dossier des tournois -------
+    @staticmethod
+    def _scan_data_dir():
+        """
+        Retourne un dictionnaire {nom de fichier: (mtime, taille)} pour chaque
+        fichier .json de DATA_DIR (vide si le dossier n'existe pas encore).
+        """
+        found = {}
+        try:
+            with os.scandir(DATA_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        st = entry.stat()
+                        found[entry.name] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+        return found
+
+    # ------- Empreinte d'un fichier isolé -------
+    @staticmethod
+    def _stat_key(path):
+        """Retourne (mtime, taille) du fichier, ou None s'il n'existe pas."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     # -----------------------
     #   SAUVEGARDE D'UN TOURNOI
@@ -149,12 +398,97 @@ class TournamentControllerBase:
         """
         Sauvegarde un tournoi spécifique dans le répertoire data/tournaments.
         Étapes :
-        1. Appelle la méthode save() de l'objet Tournament concerné
+        1. Pendant un lot de sauvegardes, note simplement le tournoi à écrire
+        2. Sinon, appelle la méthode save() de l'objet Tournament concerné
             (c'est la classe Tournament qui gère la sérialisation JSON).
         """
-        # 1️⃣ Délègue la sauvegarde de l'objet Tournament à sa propre méthode save()
+        # 1️⃣ Les infos affichées ont pu changer : invalide le cache d'affichage
+        self._mark_dirty()
+
+        # 2️⃣ Lot en cours : l'écriture est reportée à la fin du lot
+        if self._pending_saves is not None:
+            self._pending_saves.add(tournament)
+            return
+
+        # 3️⃣ Délègue la sauvegarde de l'objet Tournament à sa propre méthode save()
+        self._write(tournament)
+
+    # ------- Écriture d'un tournoi sans relecture au prochain chargement -------
+    def _write(self, tournament):
+        """
+        Écrit le tournoi sur le disque puis enregistre l'empreinte du fichier
+        écrit, pour que le prochain _load() ne relise pas ce que ce contrôleur
+        vient lui-même de sauvegarder.
+        Les cas ambigus (fichier d'un autre tournoi écrasé, tournoi inconnu
+        de la liste complète) sont laissés au prochain _load().
+        """
+        # 1️⃣ Écrit le fichier (Tournament.save gère aussi le renommage)
+        old_path = tournament.source_path
         tournament.save()
 
+        # 2️⃣ Rien à mettre à jour si aucun chargement n'a encore eu lieu
+        if self._last_scan is None:
+            return
+        name = tournament.source_path.name
+        owner = self._by_name.get(name)
+        if owner is not None and owner is not tournament:
+            return
+        if owner is None and not any(t is tournament for t in self._all_tournaments):
+            return
+
+        # 3️⃣ Renommage : l'ancien fichier a été supprimé par Tournament.save
+        if old_path is not None and old_path.name != name:
+            if self._by_name.get(old_path.name) is tournament:
+                del self._by_name[old_path.name]
+                del self._key_by_name[old_path.name]
+                self._last_scan.pop(old_path.name, None)
+
+        # 4️⃣ Mémorise l'empreinte du fichier écrit
+        key = self._stat_key(tournament.source_path)
+        self._by_name[name] = tournament
+        self._key_by_name[name] = key
+        self._last_scan[name] = key
+
+    # ------- Regroupe les sauvegardes d'une même opération -------
+    @contextmanager
+    def _batch_saves(self):
+        """
+        Ouvre un lot de sauvegardes : les appels à _save() sont mémorisés
+        puis chaque tournoi est écrit une seule fois à la sortie normale du bloc.
+        - Si le bloc lève une exception, l'état à moitié modifié n'est pas écrit.
+        - Un lot déjà ouvert est simplement réutilisé (appels imbriqués).
+        """
+        # 1️⃣ Lot déjà ouvert : rien de plus à faire
+        if self._pending_saves is not None:
+            yield
+            return
+
+        # 2️⃣ Ouvre le lot ; il est refermé même si le bloc échoue
+        self._pending_saves = set()
+        try:
+            yield
+
+            # 3️⃣ Sortie normale uniquement : écrit chaque tournoi modifié une seule fois
+            self._flush_saves()
+        finally:
+            self._pending_saves = None
+
+    # ------- Écriture immédiate des sauvegardes en attente -------
+    def _flush_saves(self):
+        """
+        Écrit tout de suite les tournois en attente du lot en cours (s'il y en a un),
+        pour qu'un message de confirmation ne soit affiché qu'après une écriture réussie.
+        Le lot reste ouvert : les _save() suivants sont de nouveau regroupés.
+        """
+        # 1️⃣ Aucun lot ouvert : les sauvegardes ont déjà été faites
+        if not self._pending_saves:
+            return
+
+        # 2️⃣ Vide la file d'attente puis écrit chaque tournoi une fois
+        pending, self._pending_saves = self._pending_saves, set()
+        for tournament in pending:
+            self._write(tournament)
+
     # -----------------------
     #   RECHARGER TOURNOIS DISQUE
     # -----------------------
@@ -165,34 +499,38 @@ class TournamentControllerBase:
         Recharge la liste des tournois à partir des fichiers JSON présents dans DATA_DIR.
         Étapes :
         1. Appelle la méthode interne _load()
-            - Vide d'abord la liste interne (_tournaments)
             - Parcourt tous les fichiers JSON dans DATA_DIR
-            - Recharge chaque tournoi valide en mémoire
+            - Recharge chaque tournoi nouveau ou modifié en mémoire
+            - Retire ceux dont le fichier a disparu
         """
         # 1️⃣ Appelle la méthode _load() pour rafraîchir la liste des tournois
         self._load()
 
     # ------- Met à jour les références d'un joueur dans tous les tournois -------
+    @batched_saves
     def update_player_references(self, updated_player):
         """
         Met à jour les références d'un joueur dans tous les tournois chargés.
         Pour chaque tournoi :
-        - Recherche un joueur ayant le même identifiant national
+        - Recherche le joueur ayant le même identifiant national
+          (unique dans un tournoi : la recherche s'arrête au premier trouvé)
         - Remplace l'ancienne instance Player par updated_player
-        - Sauvegarde le tournoi si une modification a été effectuée
-        """
-        # 1️⃣ Parcourt tous les tournois actuellement en mémoire
-        for tournament in self._tournaments:
-            changed = False  # Drapeau indiquant si une mise à jour a été faite
-
-            # 2️⃣ Parcourt tous les joueurs inscrits dans le tournoi
-            for idx, p in enumerate(tournament.players):
-                # 🅰 Vérifie si l'ID national correspond
-                if p.national_id == updated_player.national_id:
-                    # 🅱 Remplace l'ancienne instance Player par la nouvelle
-                    tournament.players[idx] = updated_player
-                    changed = True
-
-            # 3️⃣ Si une ou plusieurs références ont été mises à jour, on sauvegarde
-            if changed:
-                self._save(tournament)
+        - Marque le tournoi à sauvegarder ; chaque tournoi modifié est écrit
+          une seule fois à la fin, grâce au lot de sauvegardes
+        """
+        # 1️⃣ Identifiant recherché, lu une seule fois
+        national_id = updated_player.national_id
+
+        # 2️⃣ Parcourt uniquement les tournois où le joueur est inscrit
+        #    (copie de la liste : chaque _save() change la version de l'index)
+        for tournament in list(self._tournaments_with_player(national_id)):
+            players = tournament.players
+
+            # 3️⃣ Cherche le joueur dans le tournoi
+            for idx, p in enumerate(players):
+                if p.national_id == national_id:
+                    # 🅰 Remplace l'ancienne instance Player par la nouvelle
+                    players[idx] = updated_player
+                    # 🅱 Sauvegarde différée jusqu'à la fin du lot
+                    self._save(tournament)
+                    break
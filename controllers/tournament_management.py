@@ -13,15 +13,12 @@ Ce contrôleur étend TournamentManagementBase afin d'utiliser :
 - La gestion des répertoires de données
 """
 
-from datetime import datetime
-
 from models.tournament import Tournament
 from views.display_message import DisplayMessage
-from views.console_view import ConsoleView
-from utils.input_utils import InputUtils, MAX_ATTEMPTS
+from utils.input_utils import InputUtils, MAX_ATTEMPTS, date_key, is_valid_date
 from .tournament_controller_base import (
     TournamentControllerBase as TournamentManagementController,
-    DATA_DIR,
+    batched_saves,
 )
 
 
@@ -46,6 +43,7 @@ class TournamentManagement(TournamentManagementController):
     # -----------------------
 
     # ------- Étapes interactives pour créer un nouveau tournoi -------
+    @batched_saves
     def create_tournament(self):
         """
         Crée un nouveau tournoi en interrogeant l'utilisateur·rice étape par étape :
@@ -88,12 +86,15 @@ class TournamentManagement(TournamentManagementController):
 
         # 7️⃣ Demande le nombre de rounds (par défaut 4 si vide)
         total_rounds = self._ask_rounds()
+        if total_rounds is None:
+            return
 
         # 8️⃣ Création et enregistrement du tournoi
         tournament = Tournament(
             name, place, start_date, end_date, description, total_rounds
         )
         self._tournaments.append(tournament)
+        self._sorted_cache = None  # la liste triée mémorisée n'est plus à jour
 
         # 9️⃣ Sauvegarde et affichage de confirmation
         self._save_and_confirm(tournament)
@@ -127,7 +128,10 @@ class TournamentManagement(TournamentManagementController):
         - Autorise MAX_ATTEMPTS tentatives.
         - Retourne la date valide ou None si abandon ou trop d'erreurs.
         """
-        # 1️⃣ Boucle sur un nombre limité de tentatives
+        # 1️⃣ Calcule une seule fois la clé de la date de début (commune à toutes les tentatives)
+        start_key = date_key(start_date)
+
+        # 2️⃣ Boucle sur un nombre limité de tentatives
         for attempt in range(1, MAX_ATTEMPTS + 1):
 
             # 🅰 Demande une saisie de date en utilisant _input_date
@@ -135,12 +139,9 @@ class TournamentManagement(TournamentManagementController):
             if saisie is None:  # 🅱 Annulation directe si la saisie échoue
                 return None
 
-            # 2️⃣ Convertit les dates en objets datetime pour comparer
-            dt_start = datetime.strptime(start_date, "%d/%m/%Y")
-            dt_end = datetime.strptime(saisie, "%d/%m/%Y")
-
             # 3️⃣ Vérifie que la date de fin est postérieure ou égale à la date de début
-            if dt_end >= dt_start:
+            #    (comparaison de tuples (année, mois, jour), sans datetime)
+            if date_key(saisie) >= start_key:
                 return saisie  # 🅰 Retourne la date valide
 
             # 4️⃣ Si la saisie est incorrecte, affiche un message d'erreur et réessaie
@@ -156,23 +157,44 @@ class TournamentManagement(TournamentManagementController):
         Demande à l'utilisateur·rice le nombre de tours pour le tournoi.
         - Si aucune valeur n'est saisie, utilise 4 par défaut.
         - Vérifie que la valeur saisie est un entier positif.
-        - Répète la demande tant qu'une valeur correcte n'est pas fournie.
+        - Retourne None si l'utilisateur·rice échoue MAX_ATTEMPTS fois.
+        """
+        # 1️⃣ Délègue à la saisie commune (valeur par défaut : 4)
+        return self._input_rounds(
+            "Nombre de tours (défaut 4) : ", 4, DisplayMessage.display_tournament_rounds
+        )
+
+    # ------- Saisie commune du nombre de tours (création et modification) -------
+    def _input_rounds(self, prompt, default, display_error):
+        """
+        Demande un nombre de tours jusqu'à obtenir une saisie correcte.
+        - Si aucune valeur n'est saisie, retourne `default`.
+        - Vérifie que la valeur saisie est un entier positif.
+        - Appelle `display_error` (message propre à l'écran appelant) si la saisie est invalide.
+        - Après MAX_ATTEMPTS saisies invalides, abandonne et retourne None.
         """
-        # 1️⃣ Boucle infinie jusqu'à obtenir une saisie correcte
-        while True:
+        # 1️⃣ Boucle jusqu'à obtenir une saisie correcte (MAX_ATTEMPTS essais)
+        for _ in range(MAX_ATTEMPTS):
             # 🅰 Lecture de la saisie et suppression des espaces superflus
-            nb = input("Nombre de tours (défaut 4) : ").strip()
+            nb = input(prompt).strip()
 
-            # 2️⃣ Si l'utilisateur ne saisit rien → valeur par défaut 4
+            # 2️⃣ Si l'utilisateur ne saisit rien → valeur par défaut
             if nb == "":
-                return 4
+                return default
 
             # 3️⃣ Si la saisie est un entier positif → on retourne ce nombre
-            if nb.isdigit() and int(nb) > 0:
-                return int(nb)
+            #    (conversion faite une seule fois)
+            if nb.isdigit():
+                value = int(nb)
+                if value > 0:
+                    return value
 
             # 4️⃣ Sinon, message d'erreur et on redemande
-            DisplayMessage.display_tournament_rounds()
+            display_error()
+
+        # 5️⃣ Trop de tentatives : abandon de l'opération
+        DisplayMessage.display_abort_operation()
+        return None
 
     # ------- Sauvegarde et confirmation après création d'un tournoi -------
     def _save_and_confirm(self, tournament):
@@ -182,13 +204,17 @@ class TournamentManagement(TournamentManagementController):
         - Affiche ensuite les informations principales du tournoi.
         """
         # 1️⃣ Sauvegarde immédiate des données du tournoi dans un fichier ou une base locale
+        #    (écrite avant la confirmation, même pendant un lot de sauvegardes)
         self._save(tournament)
-
-        # 2️⃣ Affiche une confirmation visuelle de création réussie
-        DisplayMessage.display_tournament_created_message()
-
-        # 3️⃣ Affiche un récapitulatif clair des données du tournoi
-        DisplayMessage.display_tournament_info_details(tournament)
+        self._flush_saves()
+
+        # 2️⃣ Affiche en une seule écriture la confirmation de création
+        #    suivie d'un récapitulatif clair des données du tournoi
+        print(
+            DisplayMessage.render_tournament_created_message()
+            + DisplayMessage.render_tournament_info_details(tournament),
+            end="",
+        )
 
     # -----------------------
     #   LISTE TOURNOI
@@ -199,10 +225,11 @@ class TournamentManagement(TournamentManagementController):
         # 1️⃣ Recharge les données à jour depuis les fichiers
         self.reload_tournaments()
         # 2️⃣ Trie les tournois par nom (insensible à la casse)
-        tournaments_sorted = sorted(self._tournaments, key=lambda t: t.name.lower())
-        # 3️⃣ Délégation de l'affichage détaillé à ConsoleView
+        #    avec la clé précalculée name_key, tri mémorisé entre deux appels
+        tournaments_sorted = self._sorted_tournaments()
+        # 3️⃣ Délégation de l'affichage détaillé (ConsoleView, via le cache de rendu)
         #    Cette méthode va lister chaque tournoi avec ses infos clés
-        ConsoleView.show_tournaments(tournaments_sorted)
+        self._show_tournaments(tournaments_sorted)
         # 4️⃣ Si aucun tournoi n'est enregistré, affiche un message approprié
         if not tournaments_sorted:
             DisplayMessage.display_tournament_not_saved()
@@ -212,6 +239,7 @@ class TournamentManagement(TournamentManagementController):
     # -----------------------
 
     # ------- Modification des informations d'un tournoi existant -------
+    @batched_saves
     def modify_tournament(self):
         """
         Modifie les informations d'un tournoi existant en utilisant des méthodes dédiées :
@@ -230,6 +258,7 @@ class TournamentManagement(TournamentManagementController):
 
         # 3️⃣ Affiche les informations actuelles pour donner un contexte
         self._display_tournament_info(tournament)
+        old_name = tournament.name
 
         # 4️⃣ Modification des champs un par un, en utilisant les méthodes utilitaires
 
@@ -257,7 +286,11 @@ class TournamentManagement(TournamentManagementController):
         # 🅵 Nombre de tours (entier positif ou garde la valeur existante)
         tournament.total_rounds = self._edit_rounds(tournament.total_rounds)
 
-        # 5️⃣ Sauvegarde du tournoi modifié et affichage d'un résumé
+        # 5️⃣ Un changement de nom modifie l'ordre alphabétique mémorisé
+        if tournament.name != old_name:
+            self._sorted_cache = None
+
+        # 6️⃣ Sauvegarde du tournoi modifié et affichage d'un résumé
         self._confirm_and_save(tournament)
 
     # ------- Affichage des informations actuelles d'un tournoi -------
@@ -267,14 +300,16 @@ class TournamentManagement(TournamentManagementController):
         - Nom, lieu, dates, description et nombre de tours.
         - Indique que laisser un champ vide conserve la valeur actuelle.
         """
-        # 1️⃣ Affiche le titre avec le nom du tournoi
-        DisplayMessage.display_current_tournament_info()
-
-        # 2️⃣ Affiche les détails principaux du tournoi
-        DisplayMessage.display_tournament_updated_details(tournament)
-
-        # 3️⃣ Rappel pour l'utilisateur : un champ vide garde l'ancienne valeur
-        DisplayMessage.display_tournament_consigne()
+        # 1️⃣ Affiche en une seule écriture :
+        #    🅰 le titre
+        #    🅱 les détails principaux du tournoi
+        #    🅲 le rappel : un champ vide garde l'ancienne valeur
+        print(
+            DisplayMessage.render_current_tournament_info()
+            + DisplayMessage.render_tournament_updated_details(tournament)
+            + DisplayMessage.render_tournament_consigne(),
+            end="",
+        )
 
     # ------- Édition d’un champ texte avec valeur actuelle proposée -------
     def _edit_text_field(self, label, current):
@@ -297,33 +332,37 @@ class TournamentManagement(TournamentManagementController):
         - Si l'utilisateur laisse vide, conserve la date actuelle.
         - Valide le format et, si min_date est fourni, vérifie que la nouvelle date
         est postérieure ou égale à cette min_date.
+        - Après MAX_ATTEMPTS saisies invalides, abandonne et conserve la date actuelle.
         """
-        # 1️⃣ Boucle jusqu'à obtenir une saisie correcte ou conserver la valeur existante
-        while True:
-            # 🅰 Demande la saisie en affichant la valeur actuelle
-            new = input(f"{label} [{current}] : ").strip()
+        # 1️⃣ Invite construite une seule fois (affiche la valeur actuelle)
+        prompt = f"{label} [{current}] : "
+
+        # 2️⃣ Boucle jusqu'à obtenir une saisie correcte ou conserver la valeur existante
+        for _ in range(MAX_ATTEMPTS):
+            # 🅰 Demande la saisie
+            new = input(prompt).strip()
 
             # 🅱 Si aucune saisie → on garde la valeur actuelle
             if not new:
                 return current
 
-            try:
-                # 2️⃣ Conversion de la saisie en objet date pour validation
-                date_val = datetime.strptime(new, "%d/%m/%Y")
+            # 3️⃣ Validation du format de la saisie (regex précompilée, sans exception)
+            if not is_valid_date(new):
+                DisplayMessage.display_error_format_date()
+                continue  # Redemande la saisie
 
-                # 3️⃣ Si une min_date est fournie, on vérifie la cohérence
-                if min_date:
-                    min_val = datetime.strptime(min_date, "%d/%m/%Y")
-                    if date_val < min_val:
-                        DisplayMessage.display_tournament_end_date_error()
-                        continue  # Redemande la saisie
+            # 4️⃣ Si une min_date est fournie, on vérifie la cohérence
+            #    (comparaison de tuples (année, mois, jour), sans datetime)
+            if min_date and date_key(new) < date_key(min_date):
+                DisplayMessage.display_tournament_end_date_error()
+                continue  # Redemande la saisie
 
-                # 4️⃣ Retourne la nouvelle date valide
-                return new
+            # 5️⃣ Retourne la nouvelle date valide
+            return new
 
-            except ValueError:
-                # 5️⃣ En cas de format invalide, affiche un exemple et recommence
-                DisplayMessage.display_error_format_date()
+        # 6️⃣ Trop de tentatives : abandon, la date actuelle est conservée
+        DisplayMessage.display_abort_operation()
+        return current
 
     # ------- Édition du nombre de tours avec validation -------
     def _edit_rounds(self, current):
@@ -331,22 +370,17 @@ class TournamentManagement(TournamentManagementController):
         Demande un nouveau nombre de tours pour un tournoi.
         - Affiche la valeur actuelle et permet de la conserver si aucune saisie.
         - Valide que la saisie est un entier positif.
+        - Conserve la valeur actuelle après trop de saisies invalides.
         """
-        # 1️⃣ Boucle jusqu'à obtenir une saisie correcte ou conserver la valeur actuelle
-        while True:
-            # 🅰 Demande une saisie en affichant le nombre actuel
-            nb = input(f"Nombre de tours [{current}] : ").strip()
-
-            # 2️⃣ Si aucune saisie → conserve la valeur actuelle
-            if nb == "":
-                return current
-
-            # 3️⃣ Vérifie que la saisie est un entier positif
-            if nb.isdigit() and int(nb) > 0:
-                return int(nb)
+        # 1️⃣ Délègue à la saisie commune (valeur par défaut : nombre actuel)
+        rounds = self._input_rounds(
+            f"Nombre de tours [{current}] : ",
+            current,
+            DisplayMessage.display_tournament_update_rounds,
+        )
 
-            # 4️⃣ Message d'erreur si la saisie est invalide et relance la demande
-            DisplayMessage.display_tournament_update_rounds()
+        # 2️⃣ Abandon de la saisie → le nombre de tours actuel est conservé
+        return current if rounds is None else rounds
 
     # ------- Sauvegarde et confirmation après création -------
     def _confirm_and_save(self, tournament):
@@ -357,14 +391,16 @@ class TournamentManagement(TournamentManagementController):
         2. Affiche une confirmation visuelle
         3. Montre toutes les informations actuelles du tournoi
         """
-        # 1️⃣ Sauvegarde du tournoi mis à jour
+        # 1️⃣ Sauvegarde du tournoi mis à jour (écrite avant la confirmation)
         self._save(tournament)
+        self._flush_saves()
 
-        # 2️⃣ Message de confirmation
-        DisplayMessage.display_tournament_updated_message()
-
-        # 3️⃣ Affiche les informations actualisées du tournoi
-        DisplayMessage.display_tournament_info_details(tournament)
+        # 2️⃣ Message de confirmation et informations actualisées, en une seule écriture
+        print(
+            DisplayMessage.render_tournament_updated_message()
+            + DisplayMessage.render_tournament_info_details(tournament),
+            end="",
+        )
 
     # -----------------------
     #   SUPPRESSION TOURNOI
@@ -377,8 +413,9 @@ class TournamentManagement(TournamentManagementController):
         DisplayMessage.display_delete_tournament_title()
 
         # 2️⃣ Sélection du tournoi à supprimer
-        #    _choose("supprimer") affiche la liste et renvoie l'objet ou None
-        tournament = self._choose("supprimer")
+        #    _choose_indexed("supprimer") affiche la liste et renvoie
+        #    (position, objet) ou (None, None)
+        idx, tournament = self._choose_indexed("supprimer")
         if not tournament:  # Si aucun tournoi n'est sélectionné ou erreur
             return
 
@@ -387,16 +424,20 @@ class TournamentManagement(TournamentManagementController):
         if input(f"\nSupprimer {tournament.name} (o/N) ? ").lower() != "o":
             return
 
-        # 4️⃣ Construction du chemin vers le fichier JSON correspondant
-        #    On reprend la même logique que _file_path : nom en minuscules et underscores
-        path = DATA_DIR / f"{tournament.name.lower().replace(' ', '_')}.json"
-
-        # 5️⃣ Suppression du fichier JSON si présent
-        if path.exists():
-            path.unlink()  # supprime physiquement le fichier
-
-        # 6️⃣ Retrait de l'objet Tournament de la liste en mémoire
-        self._tournaments.remove(tournament)
-
-        # 7️⃣ Message de confirmation final
+        # 4️⃣ Suppression du fichier JSON d'où provient le tournoi (s'il existe)
+        #    - source_path est mémorisé au chargement/à la sauvegarde du tournoi
+        #    - missing_ok=True : un seul appel système, pas d'erreur si le fichier est absent
+        if tournament.source_path is not None:
+            tournament.source_path.unlink(missing_ok=True)
+
+        # 5️⃣ Retrait de l'objet Tournament de la liste en mémoire (par position)
+        #    et de l'index des tournois chargés
+        self._tournaments.pop(idx)
+        if tournament.source_path is not None:
+            self._by_name.pop(tournament.source_path.name, None)
+            self._key_by_name.pop(tournament.source_path.name, None)
+        self._sorted_cache = None
+        self._mark_dirty()
+
+        # 6️⃣ Message de confirmation final
         DisplayMessage.display_tournament_deleted(tournament)
@@ -11,18 +11,36 @@ Il s'appuie sur TournamentControllerBase pour :
 - Sauvegarder l'état du tournoi (_save)
 """
 
+import re
+from operator import attrgetter
+
 from views.display_message import DisplayMessage
 from models.player import Player
 from .tournament_controller_base import (
     TournamentControllerBase as TournamentPlayersController,
 )
 
+# Clé de tri des joueurs inscrits : NOM puis prénom (précalculée sur Player)
+PLAYER_NAME_KEY = attrgetter("sort_key")
+
+# Extraction de l'identifiant national d'un joueur
+PLAYER_ID = attrgetter("national_id")
+
+# Séparateurs d'une sélection ("1, 3 5" → "1", "3", "5") et forme d'un numéro valide
+SELECTION_SEP_RE = re.compile(r"[,\s]+")
+NUM_RE = re.compile(r"[0-9]+")
+
 
 class TournamentPlayers(TournamentPlayersController):
     """
     Sous-contrôleur pour gérer l'ajout et le retrait de joueurs dans un tournoi.
     """
 
+    # Messages émis dans la boucle d'analyse des numéros saisis,
+    # liés une fois pour toutes au chargement de la classe
+    _warn_duplicate = staticmethod(DisplayMessage.display_player_duplicate_warning)
+    _warn_not_added = staticmethod(DisplayMessage.display_player_not_added)
+
     # -----------------------
     #   AJOUT/RETRAIT JOUEUR(S)
     # -----------------------
@@ -48,17 +66,21 @@ class TournamentPlayers(TournamentPlayersController):
         # 2️⃣ Recharge la liste des tournois depuis le dossier /data/tournaments
         self.reload_tournaments()
 
-        # 3️⃣ Filtre les tournois pour ne garder que ceux "non démarré", triés A→Z
-        self._tournaments = sorted(
-            [t for t in self._tournaments if t.status == "non démarré"],
-            key=lambda t: t.name.lower(),
-        )
+        # 3️⃣ Filtre les tournois pour ne garder que ceux "non démarré"
+        #    (liste locale de l'index partagé : self._tournaments reste complète ;
+        #    le tri A→Z est fait par _choose sur la clé name_key)
+        not_started = self._with_status("non démarré")
 
         # 4️⃣ Demande à l’utilisateur de choisir un tournoi à gérer
-        tournament = self._choose("gérer les joueurs de")
+        tournament = self._choose("gérer les joueurs de", tournament_list=not_started)
         if not tournament:  # ❌ Annule si aucun tournoi n’est sélectionné
             return
 
+        # 🅰 Trie une seule fois les inscrits par NOM puis prénom :
+        #    chaque lot d'ajouts est ensuite fusionné par un seul tri
+        #    et les retraits conservent l'ordre, la liste reste donc triée
+        tournament.players.sort(key=PLAYER_NAME_KEY)
+
         # 5️⃣ Boucle principale : propose d’ajouter, retirer ou quitter
         while True:
             # 🅰 Affiche les infos du tournoi + menu d’options
@@ -81,14 +103,16 @@ class TournamentPlayers(TournamentPlayersController):
         Affiche les informations principales d'un tournoi
         et présente le menu de gestion des joueurs (ajout/retrait).
         """
-        # 1️⃣ Affiche un titre visuel
-        DisplayMessage.display_tournament_title()
-
-        # 2️⃣ Affiche les informations détaillées du tournoi
-        DisplayMessage.display_tournament_info(tournament)
-
-        # 3️⃣ Affiche les options disponibles pour la gestion des joueurs
-        DisplayMessage.display_manage_players_menu()
+        # 1️⃣ Construit puis affiche en une seule écriture :
+        #    🅰 le titre visuel
+        #    🅱 les informations détaillées du tournoi
+        #    🅲 les options disponibles pour la gestion des joueurs
+        print(
+            DisplayMessage.render_tournament_title()
+            + DisplayMessage.render_tournament_info(tournament)
+            + DisplayMessage.render_manage_players_menu(),
+            end="",
+        )
 
     # -----------------------
     #   AJOUTER JOUEUR(S)
@@ -102,15 +126,9 @@ class TournamentPlayers(TournamentPlayersController):
         2. Permet de sélectionner plusieurs joueurs par numéro
         3. Met à jour la liste des joueurs et sauvegarde
         """
-        # 1️⃣ Récupère tous les joueurs triés par NOM puis prénom
-        all_players = sorted(Player.registry, key=lambda p: (p.last_name, p.first_name))
-
-        # 2️⃣ Filtre ceux qui ne sont pas déjà inscrits dans le tournoi
-        available = [
-            p
-            for p in all_players
-            if p.national_id not in {tp.national_id for tp in tournament.players}
-        ]
+        # 1️⃣ + 2️⃣ Récupère les joueurs triés par NOM puis prénom
+        #    qui ne sont pas déjà inscrits dans le tournoi
+        available = self._available_players(tournament)
 
         # 3️⃣ Si aucun joueur disponible, affiche un message et quitte
         if not available:
@@ -137,45 +155,26 @@ class TournamentPlayers(TournamentPlayersController):
     # ------- Traitement de la saisie des joueurs sélectionnés et ajout au tournoi -------
     def _process_selected_players(self, nums, available, tournament):
         """Analyse la saisie de l'utilisateur et ajoute les joueurs au tournoi."""
-        added = []  # Liste des joueurs ajoutés
-        seen = set()  # Ensemble pour éviter les doublons de saisie
-
-        # Traite chaque numéro saisi
-        for token in nums.split(","):
-            token = token.strip()
+        # 1️⃣ Analyse la saisie avec le parseur commun (doublons et numéros invalides signalés)
+        added = self._parse_player_selection(nums, available)
 
-            # 🅰 Ignore les valeurs qui ne sont pas numériques
-            if not token.isdigit():
-                continue
-
-            # 🅱 Ignore les doublons de saisie
-            if token in seen:
-                DisplayMessage.display_player_duplicate_warning(token)
-                continue
-            seen.add(token)
-
-            # 🅲 Vérifie que le numéro correspond à un joueur disponible
-            idx = int(token) - 1
-            if 0 <= idx < len(available):
-                p = available[idx]
-                tournament.players.append(p)  # Ajoute le joueur au tournoi
-                added.append(p)
-            else:
-                DisplayMessage.display_player_not_added(token)
+        # 2️⃣ Ajoute tous les joueurs d'un coup puis trie une seule fois :
+        #    la liste des inscrits était déjà triée, le tri fusionne donc
+        #    simplement les nouveaux venus
+        if added:
+            tournament.players.extend(added)
+            tournament.players.sort(key=PLAYER_NAME_KEY)
 
         return added
 
     # ------- Finalisation après ajout des joueurs (tri, sauvegarde et affichage) -------
     def _finalize_added_players(self, added, tournament):
-        """Trie, sauvegarde et affiche le résultat final de l'ajout des joueurs."""
+        """Sauvegarde et affiche le résultat final de l'ajout des joueurs."""
         if added:
-            # 🅰 Trie la liste des joueurs inscrits après l'ajout
-            tournament.players.sort(key=lambda p: (p.last_name, p.first_name))
-
-            # 🅱 Sauvegarde le tournoi mis à jour
+            # 🅰 Sauvegarde le tournoi mis à jour (liste déjà triée)
             self._save(tournament)
 
-            # 🅲 Affiche les joueurs qui viennent d'être ajoutés
+            # 🅱 Affiche les joueurs qui viennent d'être ajoutés
             DisplayMessage.display_player_added(added)
         else:
             # 9️⃣ Si aucun ajout n'a eu lieu
@@ -200,7 +199,7 @@ class TournamentPlayers(TournamentPlayersController):
             DisplayMessage.display_no_players_in_tournament()
             return
 
-        # 2️⃣ Trie et affiche les joueurs inscrits
+        # 2️⃣ Affiche les joueurs inscrits (liste déjà triée)
         self._display_registered_players(tournament)
 
         # 3️⃣ Demande la liste des joueurs à retirer
@@ -217,39 +216,80 @@ class TournamentPlayers(TournamentPlayersController):
 
     # ------- Affichage des joueurs inscrits dans un tournoi -------
     def _display_registered_players(self, tournament):
-        """Trie et affiche la liste numérotée des joueurs inscrits au tournoi."""
-        tournament.players.sort(key=lambda p: (p.last_name, p.first_name))
+        """Affiche la liste numérotée (déjà triée) des joueurs inscrits au tournoi."""
         DisplayMessage.display_registered_players_list(tournament)
 
     # ------- Sélection des joueurs à retirer d’un tournoi -------
     def _ask_players_to_remove(self, tournament):
         """Demande à l'utilisateur quels joueurs retirer et retourne une liste d'objets joueurs."""
         nums = input("\nNuméros à retirer (séparés par des virgules) : ")
-        to_remove = []
-        for token in nums.split(","):
-            token = token.strip()
-            if not token.isdigit():
-                continue
-            idx = int(token) - 1
-            if 0 <= idx < len(tournament.players):
-                to_remove.append(tournament.players[idx])
-        return to_remove
+        # Seuls les numéros valides sont retenus (une seule fois chacun)
+        return self._select_valid_numbers(nums, tournament.players)
+
+    # ------- Sélection stricte pour le retrait (saisies invalides signalées) -------
+    def _select_valid_numbers(self, nums, available):
+        """
+        Retourne les joueurs de `available` désignés par les numéros saisis.
+        - Les doublons sont ignorés sans message
+        - Les saisies non numériques ou hors liste sont signalées et ignorées,
+          pour qu'une faute de frappe ne sélectionne jamais un joueur
+        """
+        selected = []
+        for status, token, player in self._iter_parsed_selection(nums, available):
+            if status == "ok":
+                selected.append(player)
+            elif status == "bad":
+                self._warn_not_added(token)
+        return selected
 
     # ------- Confirmation et suppression des joueurs sélectionnés -------
     def _confirm_and_remove_players(self, tournament, to_remove):
-        """Demande confirmation et supprime les joueurs sélectionnés du tournoi."""
-        removed = []
-        for p in to_remove:
-            if input(f"Supprimer {p.last_name} {p.first_name} (o/N) ? ").lower() == "o":
-                tournament.players.remove(p)
-                removed.append(p)
-        return removed
+        """
+        Demande une seule confirmation pour l'ensemble des joueurs sélectionnés
+        et les supprime du tournoi.
+        - "o" ou "tout" : retire tous les joueurs listés
+        - "i"           : demande une confirmation joueur par joueur
+        - numéros       : retire seulement les joueurs listés sous ces numéros
+        - vide ou "n"   : ne retire personne
+        """
+        # 1️⃣ Affiche une seule fois la liste des joueurs à retirer
+        DisplayMessage.display_players_to_remove(to_remove)
+
+        # 2️⃣ Une seule saisie pour tout le lot
+        reply = input(
+            "Confirmer la suppression (o = tout / i = un par un / numéros / N = aucun) : "
+        ).strip().lower()
+
+        # 3️⃣ Détermine les joueurs confirmés
+        if reply in ("o", "tout"):
+            # 🅰 Tout le lot
+            confirmed = to_remove
+        elif reply == "i":
+            # 🅱 Confirmation individuelle (une question par joueur)
+            confirmed = [
+                p
+                for p in to_remove
+                if input(f"Supprimer {p.last_name} {p.first_name} (o/N) ? ").lower() == "o"
+            ]
+        elif reply in ("", "n", "non"):
+            # 🅲 Refus explicite : personne n'est retiré
+            confirmed = []
+        else:
+            # 🅳 Numéros de la liste affichée (saisies invalides signalées et ignorées)
+            confirmed = self._select_valid_numbers(reply, to_remove)
+
+        # 4️⃣ Retire les joueurs confirmés du tournoi en un seul parcours
+        #    (l'ordre des joueurs restants est conservé)
+        if confirmed:
+            removal = set(confirmed)
+            tournament.players[:] = [p for p in tournament.players if p not in removal]
+        return list(confirmed)
 
     # ------- Finalisation après suppression des joueurs -------
     def _finalize_player_removal(self, tournament, removed):
-        """Trie, sauvegarde et affiche le résultat final après suppression."""
+        """Sauvegarde et affiche le résultat final après suppression."""
         if removed:
-            tournament.players.sort(key=lambda p: (p.last_name, p.first_name))
+            # Le retrait conserve l'ordre : inutile de trier à nouveau
             self._save(tournament)
             DisplayMessage.display_finalize_player_removal(removed)
         else:
@@ -260,14 +300,24 @@ class TournamentPlayers(TournamentPlayersController):
         """
         Retourne la liste des joueurs disponibles pour un tournoi donné.
         - Trie tous les joueurs par nom puis prénom.
-        - Exclut ceux qui sont déjà inscrits dans le tournoi.
+        - Exclut ceux qui sont déjà inscrits dans le tournoi (comparaison par
+          identifiant national, les objets Player pouvant venir d'un autre chargement).
         """
 
-        # 1️⃣ Récupère tous les joueurs triés par NOM puis prénom
-        all_players = sorted(Player.registry, key=lambda p: (p.last_name, p.first_name))
+        # 1️⃣ Récupère tous les joueurs triés par NOM puis prénom (tri mémorisé)
+        all_players = Player.sorted_registry()
 
-        # 2️⃣ Filtre et retourne uniquement les joueurs non encore inscrits
-        return [p for p in all_players if p not in tournament.players]
+        # 🅰 Aucun inscrit (nouveau tournoi) : tous les joueurs sont disponibles,
+        #    copie de la liste triée partagée sans filtrage
+        if not tournament.players:
+            return list(all_players)
+
+        # 2️⃣ Identifiants des inscrits, extraits en une passe et calculés une seule fois
+        #    (test d'appartenance O(1))
+        enrolled = set(map(PLAYER_ID, tournament.players))
+
+        # 3️⃣ Filtre et retourne uniquement les joueurs non encore inscrits
+        return [p for p in all_players if p.national_id not in enrolled]
 
     # ------- Affichage d'une liste numérotée de joueurs avec titre -------
     def _show_player_list(self, players, title):
@@ -286,33 +336,62 @@ class TournamentPlayers(TournamentPlayersController):
         Analyse une saisie utilisateur contenant des numéros séparés par des virgules.
         Retourne la liste des joueurs correspondants dans `available`.
 
-        - Ignore les valeurs non numériques
+        - Signale et ignore les valeurs non numériques
         - Ignore les doublons et prévient l'utilisateur
         - Vérifie que chaque numéro correspond à un joueur disponible
         """
-        # 1️⃣ Prépare la liste des joueurs sélectionnés et un set pour éviter les doublons
+        # 1️⃣ Prépare la liste des joueurs sélectionnés
         selected = []
-        seen = set()
 
-        # 2️⃣ Découpe la chaîne saisie par l'utilisateur sur les virgules
-        for token in nums.split(","):
-            token = token.strip()
+        # 2️⃣ Parcourt les numéros analysés et décide de l'effet de chacun
+        for status, token, player in self._iter_parsed_selection(nums, available):
+            if status == "ok":
+                selected.append(player)
+            elif status == "dup":
+                self._warn_duplicate(token)
+            else:
+                self._warn_not_added(token)
 
-            # 3️⃣ Vérifie que la saisie est bien un nombre et pas déjà vue
-            if not token.isdigit() or token in seen:
-                if token in seen:
-                    DisplayMessage.display_player_duplicate_warning(token)
-                continue
+        # 3️⃣ Retourne la liste des joueurs sélectionnés valides
+        return selected
+
+    # ------- Analyse commune d'une saisie de numéros -------
+    @staticmethod
+    def _iter_parsed_selection(nums, available):
+        """
+        Parcourt les numéros saisis (séparés par des virgules ou des espaces) et produit,
+        pour chacun,
+        un tuple (statut, numéro saisi, joueur) sans aucun affichage :
+        - ("ok", numéro, joueur)  : numéro valide, première occurrence
+        - ("dup", numéro, None)   : numéro déjà saisi ("1" et "01" sont identiques)
+        - ("bad", saisie, None)   : saisie non numérique ("1.5", "2-4", "1a"…)
+                                    ou numéro hors de la liste `available`
+        """
+        # 1️⃣ Index déjà vus et borne des index valides, calculée une fois
+        seen = set()
+        n_available = len(available)
 
-            # 4️⃣ Ajoute le numéro dans l'ensemble pour éviter les doublons
-            seen.add(token)
+        # 2️⃣ Découpe la saisie et vérifie que chaque élément est entièrement numérique
+        for token in SELECTION_SEP_RE.split(nums.strip()):
+            # Élément vide (séparateur en tête ou en fin) → ignoré
+            if not token:
+                continue
+            # Faute de frappe ("1.5", "-3"…) → signalée, jamais convertie en numéro
+            if not NUM_RE.fullmatch(token):
+                yield "bad", token, None
+                continue
 
-            # 5️⃣ Convertit en index (base 0) et vérifie qu'il est valide
+            # 🅰 Convertit en index (base 0)
             idx = int(token) - 1
-            if 0 <= idx < len(available):
-                selected.append(available[idx])
-            else:
-                DisplayMessage.display_player_not_added(token)
 
-        # 6️⃣ Retourne la liste des joueurs sélectionnés valides
-        return selected
+            # 🅱 Numéro déjà vu
+            if idx in seen:
+                yield "dup", token, None
+                continue
+            seen.add(idx)
+
+            # 🅲 Numéro valide ou hors de la liste
+            if 0 <= idx < n_available:
+                yield "ok", token, available[idx]
+            else:
+                yield "bad", token, None
@@ -4,6 +4,8 @@ Affiche les classements, rapports et propose l'export des données.
 """
 
 import csv
+import html
+from operator import attrgetter
 from models.player import Player
 from views.console_view import ConsoleView
 from views.display_message import DisplayMessage
@@ -40,10 +42,8 @@ class TournamentReports(TournamentReportsController):
         self.reload_tournaments()
 
         # 2️⃣ Ne conserve que les tournois en cours ou terminés (statut != "non démarré")
-        eligible = sorted(
-            [t for t in self._tournaments if t.status != "non démarré"],
-            key=lambda t: t.name.lower(),
-        )
+        #    (le tri par nom est fait par _choose)
+        eligible = self._with_status("en cours") + self._with_status("terminé")
 
         # 3️⃣ Si aucun tournoi éligible, affiche un message et quitte
         if not eligible:
@@ -72,11 +72,8 @@ class TournamentReports(TournamentReportsController):
         7. Prépare les données pour un éventuel export
         8. Propose l'export des données (CSV, JSON, etc.)
         """
-        # 1️⃣ Collecte des identifiants uniques des joueurs inscrits
-        ids = set()
-        for t in self._tournaments:
-            for p in t.players:
-                ids.add(p.national_id)
+        # 1️⃣ Collecte des identifiants uniques des joueurs inscrits (une seule passe)
+        ids = {p.national_id for t in self._tournaments for p in t.players}
 
         # 2️⃣ Si aucun joueur n'est inscrit à aucun tournoi
         if not ids:
@@ -84,10 +81,12 @@ class TournamentReports(TournamentReportsController):
             return
 
         # 3️⃣ Construit une liste des joueurs correspondant aux IDs collectés
-        registered = [p for p in Player.registry if p.national_id in ids]
+        #    via l'index Player.by_id (joueurs supprimés du registre ignorés)
+        by_id = Player.by_id
+        registered = [by_id[i] for i in ids if i in by_id]
 
         # 4️⃣ Trie les joueurs par nom puis par prénom
-        registered.sort(key=lambda p: (p.last_name, p.first_name))
+        registered.sort(key=attrgetter("sort_key"))
 
         # 5️⃣ Affiche la liste via la vue console
         DisplayMessage.display_players_tournament_title()
@@ -160,7 +159,7 @@ class TournamentReports(TournamentReportsController):
         DisplayMessage.display_tournament_players_title_report(tournament)
 
         # 4️⃣ Trie la liste des joueurs par NOM puis prénom
-        order = sorted(tournament.players, key=lambda p: (p.last_name, p.first_name))
+        order = sorted(tournament.players, key=attrgetter("sort_key"))
 
         # 5️⃣ Affiche les joueurs via la vue console
         ConsoleView.show_players(order)
@@ -190,26 +189,29 @@ class TournamentReports(TournamentReportsController):
             DisplayMessage.display_no_rounds_available()
             return
 
-        # 3️⃣ Affiche tous les rounds et les matchs associés
-        for idx, rnd in enumerate(tournament.rounds, 1):
-            DisplayMessage.display_round_details(idx)
-            DisplayMessage.display_match_details(rnd)
-
-        # 4️⃣ Prépare les données sous forme tabulaire pour un export
+        # 3️⃣ Un seul parcours des rounds et matchs : construit à la fois
+        #    le texte affiché et les lignes tabulaires pour un export
+        lines = []
         rows = []
         for idx, rnd in enumerate(tournament.rounds, 1):
+            lines.append(DisplayMessage.render_round_details(idx))
+            round_label = f"Round {idx}"
             for m in rnd.matches:
-                p1, p2 = m.players
-                s1, s2 = m.scores
-                rows.append(
-                    [
-                        f"Round {idx}",
-                        f"{p1.last_name} {p1.first_name}",
-                        f"{p2.last_name} {p2.first_name}",
-                        s1,
-                        s2,
-                    ]
+                # 🅰 Joueurs, scores et noms complets calculés une seule fois
+                p1, p2 = m.p1, m.p2
+                s1, s2 = m.s1, m.s2
+                name1 = p1.full_name
+                name2 = p2.full_name
+                # 🅱 Ligne affichée et ligne exportée
+                lines.append(
+                    DisplayMessage.render_match_line(
+                        name1, p1.national_id, s1, s2, name2, p2.national_id
+                    )
                 )
+                rows.append([round_label, name1, name2, s1, s2])
+
+        # 4️⃣ Affiche tous les rounds et les matchs associés en une seule écriture
+        print("".join(lines), end="")
 
         # 5️⃣ Définition des en-têtes et du nom de fichier d'export
         headers = ["Round", "Joueur 1", "Joueur 2", "Score 1", "Score 2"]
@@ -227,7 +229,7 @@ class TournamentReports(TournamentReportsController):
         """
         Exporte des données dans un fichier au format CSV ou HTML.
         Paramètres :
-        - rows     : liste de listes, chaque sous-liste représente une ligne
+        - rows     : itérable de lignes (listes), parcouru une seule fois
         - headers  : liste des noms de colonnes
         - filename : nom du fichier (sans extension)
         - fmt      : format d'export, "csv" ou autre (HTML par défaut)
@@ -246,7 +248,8 @@ class TournamentReports(TournamentReportsController):
         # 3️⃣ Si le format demandé est CSV
         if fmt == "csv":
             # 🅰 Ouvre le fichier en écriture texte avec UTF-8
-            with path.open("w", newline="", encoding="utf-8") as f:
+            #    (tampon de 1 Mo : les lignes partent en quelques écritures groupées)
+            with path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 # 🅱 Écrit la ligne d'en-têtes
                 writer.writerow(headers)
@@ -255,20 +258,24 @@ class TournamentReports(TournamentReportsController):
 
         else:
             # 4️⃣ Si le format n'est pas CSV → export HTML
-            with path.open("w", encoding="utf-8") as f:
-                # 🅰 Début du tableau HTML avec en-têtes
-                f.write("<table border='1'>\n<tr>")
-                for h in headers:
-                    f.write(f"<th>{h}</th>")
-                f.write("</tr>\n")
-
-                # 🅱 Ajoute les lignes de données
-                for row in rows:
-                    cells = "".join(f"<td>{c}</td>" for c in row)
-                    f.write(f"<tr>{cells}</tr>\n")
-
-                # 🅲 Fin du tableau
-                f.write("</table>")
+            #    Le document est assemblé en mémoire puis écrit en une seule fois ;
+            #    chaque valeur est échappée (&, <, >, guillemets)
+            # 🅰 Début du tableau HTML avec en-têtes
+            parts = ["<table border='1'>\n<tr>"]
+            parts.extend(f"<th>{html.escape(str(h))}</th>" for h in headers)
+            parts.append("</tr>\n")
+
+            # 🅱 Ajoute les lignes de données
+            parts.extend(
+                "<tr>"
+                + "".join(f"<td>{html.escape(str(c))}</td>" for c in row)
+                + "</tr>\n"
+                for row in rows
+            )
+
+            # 🅲 Fin du tableau, puis écriture unique
+            parts.append("</table>")
+            path.write_text("".join(parts), encoding="utf-8")
 
         # 5️⃣ Affiche un message confirmant la création du fichier
         DisplayMessage.display_export_success(path)
@@ -278,7 +285,7 @@ class TournamentReports(TournamentReportsController):
         """
         Propose à l'utilisateur d'exporter un rapport et lance l'export si validé.
         Paramètres :
-        - rows         : liste de lignes (liste de listes) à exporter
+        - rows         : itérable de lignes (listes) à exporter
         - headers      : liste des noms de colonnes
         - default_name : nom de fichier sans extension
         Étapes :
@@ -12,12 +12,24 @@ pour la gestion des tournois et la persistance des données.
 """
 
 # from models import tournament
+from operator import attrgetter
+
 from views.display_message import DisplayMessage
 from views.console_view import ConsoleView
 from .tournament_controller_base import (
     TournamentControllerBase as TournamentRoundController,
+    batched_saves,
 )
 
+# Scores autorisés et couple de points correspondant (joueur 1, joueur 2)
+SCORE_MAP = {"1-0": (1.0, 0.0), "0-1": (0.0, 1.0), "0.5-0.5": (0.5, 0.5)}
+
+# Table de str.translate supprimant tous les blancs d'une saisie en une passe
+WHITESPACE = str.maketrans("", "", " \t\r\n")
+
+# À partir de ce nombre de matchs, les scores sont saisis en une seule ligne
+BATCH_SCORES_MIN_MATCHES = 4
+
 
 class TournamentRound(TournamentRoundController):
     """
@@ -55,7 +67,7 @@ class TournamentRound(TournamentRoundController):
         self.reload_tournaments()
 
         # 3️⃣ Ne garde que les tournois non démarrés
-        non_started = [t for t in self._tournaments if t.status == "non démarré"]
+        non_started = self._with_status("non démarré")
 
         # 4️⃣ Vérifie qu'il en reste
         if not non_started:
@@ -143,18 +155,21 @@ class TournamentRound(TournamentRoundController):
         - Liste les matchs sous la forme :
             Joueur1 [ID] VS Joueur2 [ID]
         """
-        # 1️⃣ Parcourt tous les rounds du tournoi avec leur index
-        for idx, rnd in enumerate(tournament.rounds, 1):
-            # 🅰 Affiche le numéro du round
-            DisplayMessage.display_round_details(idx)
+        # 1️⃣ Prépare le texte de chaque round : son numéro puis ses matchs
+        blocks = [
+            DisplayMessage.render_round_details(idx)
+            + DisplayMessage.render_round_matches(rnd)
+            for idx, rnd in enumerate(tournament.rounds, 1)
+        ]
 
-            # 🅱 Affiche chaque match avec les deux joueurs
-            DisplayMessage.display_round_matches(rnd)
+        # 2️⃣ Affiche tous les rounds en une seule écriture
+        print("".join(blocks), end="")
 
     # -----------------------
     #   ROUND SUIVANT
     # -----------------------
 
+    @batched_saves
     def start_next_round(self):
         """
         Démarre le round suivant du tournoi sélectionné.
@@ -174,11 +189,8 @@ class TournamentRound(TournamentRoundController):
         # 2️⃣ Recharge les données à jour depuis les fichiers
         self.reload_tournaments()
 
-        # 3️⃣ Filtre les tournois avec statut "en cours" et trie par nom
-        in_progress = sorted(
-            [t for t in self._tournaments if t.status == "en cours"],
-            key=lambda t: t.name.lower(),
-        )
+        # 3️⃣ Filtre les tournois avec statut "en cours" (triés par nom dans _choose)
+        in_progress = self._with_status("en cours")
 
         # 4️⃣ Si aucun tournoi en cours, message d'information
         if not in_progress:
@@ -193,22 +205,22 @@ class TournamentRound(TournamentRoundController):
         if not tournament:
             return
 
-        # 6️⃣ Vérifie si le dernier round est clôturé
-        if tournament.rounds and not tournament.rounds[-1].end_time:
-            DisplayMessage.display_round_in_progress()
-            return
-
-        # 7️⃣ Si tous les rounds ont été joués, on clôture sans message
-        if tournament.current_round_index >= tournament.total_rounds and all(
-            r.end_time for r in tournament.rounds
-        ):
-            tournament.status = "terminé"
-            self._save(tournament)
+        # 6️⃣ Le modèle indique en une passe si le round suivant peut démarrer
+        ok, reason = tournament.can_start_next_round()
+        if not ok:
+            # 🅰 Dernier round pas encore clôturé
+            if reason == "open_round":
+                DisplayMessage.display_round_in_progress()
+            # 🅱 Tous les rounds ont été joués : on clôture sans message
+            elif reason == "max_rounds":
+                tournament.status = "terminé"
+                self._save(tournament)
             return
 
         # 8️⃣ Démarre le prochain round
         tournament.start_next_round()
         self._save(tournament)
+        self._flush_saves()
         DisplayMessage.display_next_round_started()
 
     # -----------------------
@@ -216,6 +228,7 @@ class TournamentRound(TournamentRoundController):
     # -----------------------
 
     # ------- Saisie et enregistrement des scores du round en cours -------
+    @batched_saves
     def enter_scores_current_round(self):
         """
         Saisie des scores du round en cours.
@@ -227,11 +240,8 @@ class TournamentRound(TournamentRoundController):
         # 2️⃣ Recharge les tournois depuis les fichiers présents dans /data/tournaments
         self.reload_tournaments()
 
-        # 3️⃣ Filtre les tournois avec statut "en cours" (et trie par ordre alphabétique)
-        in_progress = sorted(
-            [t for t in self._tournaments if t.status == "en cours"],
-            key=lambda t: t.name.lower(),
-        )
+        # 3️⃣ Filtre les tournois avec statut "en cours" (triés par nom dans _choose)
+        in_progress = self._with_status("en cours")
 
         # 4️⃣ Si aucun tournoi en cours, affiche un message d'information et quitte
         if not in_progress:
@@ -251,14 +261,20 @@ class TournamentRound(TournamentRoundController):
             return
 
         # 8️⃣ Collecte les scores pour chaque match du round
-        results, recap = self._collect_scores(rnd, num, tournament.name)
+        #    (saisie groupée sur une ligne pour les rounds les plus longs)
+        if len(rnd.matches) >= BATCH_SCORES_MIN_MATCHES:
+            collect = self._collect_scores_batched
+        else:
+            collect = self._collect_scores
+        results, recap = collect(rnd, num, tournament.name)
 
         # 9️⃣ Enregistre les résultats et sauvegarde l’état du tournoi
         tournament.record_results(results)
         self._save(tournament)
 
-        # 🔟 Affiche un récapitulatif des scores saisis
+        # 🔟 Affiche un récapitulatif des scores saisis, une fois ceux-ci écrits
         if tournament.current_round_index < tournament.total_rounds:
+            self._flush_saves()
             self._display_scores_recap(recap, num)
 
         # 🏁 Si tous les rounds ont été joués, on clôture le tournoi et annonce le vainqueur
@@ -275,28 +291,39 @@ class TournamentRound(TournamentRoundController):
         2. Résultat du duel direct si égalité
         3. Ordre alphabétique en cas d'égalité parfaite
         """
-        # ✅ 🔔 Message clair de fin de tournoi après saisie du dernier score
-        DisplayMessage.display_last_scores_saved()
-
         # 1️⃣ Met à jour le statut du tournoi et sauvegarde
+        #    (derniers scores et statut écrits ensemble)
         tournament.status = "terminé"
         self._save(tournament)
+        self._flush_saves()
 
-        # 2️⃣ Récupère le score maximal et les joueurs ex-æquo
-        top_score = max(p.points for p in tournament.players)
-        top_players = [p for p in tournament.players if p.points == top_score]
+        # ✅ 🔔 Message clair de fin de tournoi, une fois la sauvegarde réussie
+        DisplayMessage.display_last_scores_saved()
+
+        # 2️⃣ Récupère le score maximal et les joueurs ex-æquo en une seule passe
+        top_score = float("-inf")
+        top_players = []
+        for p in tournament.players:
+            points = p.points
+            if points > top_score:
+                top_score = points
+                top_players = [p]
+            elif points == top_score:
+                top_players.append(p)
 
         # 3️⃣ S'il y a un seul gagnant, on l'affiche directement
         if len(top_players) == 1:
             winner = top_players[0]
         else:
             # 4️⃣ Si plusieurs joueurs ont le même score : tentative de départage par duel direct
+            #    (ensemble des ex-æquo construit une seule fois pour tous les matchs)
             winner = None
+            top_set = set(top_players)
             for rnd in tournament.rounds:
                 for match in rnd.matches:
-                    p1, p2 = match.players
-                    s1, s2 = match.scores
-                    if {p1, p2} <= set(top_players):
+                    p1, p2 = match.p1, match.p2
+                    if p1 in top_set and p2 in top_set:
+                        s1, s2 = match.s1, match.s2
                         if s1 > s2:
                             winner = p1
                         elif s2 > s1:
@@ -306,11 +333,9 @@ class TournamentRound(TournamentRoundController):
                     break
 
             # 5️⃣ Si match nul ou aucun duel, départage alphabétique
+            #    (clé de tri précalculée sur Player, premier par ordre alphabétique)
             if not winner:
-                winner = sorted(
-                    top_players,
-                    key=lambda p: (p.last_name.lower(), p.first_name.lower()),
-                )[0]
+                winner = min(top_players, key=attrgetter("sort_key"))
 
         # 6️⃣ Affiche le message de fin de tournoi et le classement final
         DisplayMessage.display_end_tournament_message(tournament, winner)
@@ -376,35 +401,62 @@ class TournamentRound(TournamentRoundController):
         # 1️⃣ Affiche le titre et les instructions de saisie
         DisplayMessage.display_tournament_consigne_title(tournament_name, num)
 
-        results = []  # contiendra les scores sous une forme prête pour record_results
-        recap = []  # contiendra les données pour affichage final
-
-        # 2️⃣ Parcourt les matchs du round
-        for i, m in enumerate(rnd.matches, 1):
-            p1, p2 = m.players
-            while True:
-                # 🅰 Demande la saisie du score
-                s = (
-                    input(
-                        f"{p1.last_name} {p1.first_name}[{p1.national_id}] VS "
-                        f"{p2.last_name} {p2.first_name}[{p2.national_id}] : "
-                    )
-                    .strip()
-                    .replace(" ", "")
-                )
-
-                # 🅱 Vérifie le format de la saisie
-                if s in ("1-0", "0-1", "0.5-0.5"):
-                    a, b = map(float, s.split("-"))
-                    break
+        # 2️⃣ Demande un score valide pour chaque match du round
+        #    (la saisie et la validation sont faites par _ask_match_score)
+        pairs = [self._ask_match_score(m) for m in rnd.matches]
 
-                # 🅲 Message d'erreur si format incorrect
-                DisplayMessage.display_tournament_scores_example()
+        # 3️⃣ Construit results et recap à partir des scores saisis
+        return self._build_score_lists(rnd, num, pairs)
 
-            # 🅳 Ajoute le résultat au tableau results et recap
-            results.append((num - 1, i - 1, a, b))
-            recap.append((p1, p2, a, b))
+    # ------- Collecte groupée des scores d’un round (une seule saisie) -------
+    def _collect_scores_batched(self, rnd, num, tournament_name):
+        """
+        Collecte les scores de tous les matchs du round en une seule saisie.
+        Étapes :
+        1. Affiche l'en-tête puis la liste numérotée des matchs
+        2. Lit une ligne de scores séparés par des virgules (ex. 1-0,0.5-0.5,0-1),
+           redemandée en entier si elle contient plus de scores que de matchs
+        3. Redemande, match par match, uniquement les scores absents ou invalides
+        Retourne (results, recap) au même format que _collect_scores.
+        """
+        # 1️⃣ En-tête et liste des matchs affichés une seule fois
+        DisplayMessage.display_tournament_consigne_title(tournament_name, num)
+        DisplayMessage.display_numbered_round_matches(rnd)
 
+        # 2️⃣ Une seule saisie pour tout le round
+        #    (trop de scores → décalage probable : la ligne entière est redemandée)
+        nb_matches = len(rnd.matches)
+        while True:
+            raw = input("\nScores (séparés par des virgules) : ")
+            tokens = raw.translate(WHITESPACE).split(",")
+            if len(tokens) <= nb_matches:
+                break
+            DisplayMessage.display_too_many_scores(len(tokens), nb_matches)
+        pairs = [SCORE_MAP.get(t) for t in tokens]
+        pairs.extend([None] * (nb_matches - len(pairs)))
+
+        # 3️⃣ Liste les matchs à ressaisir puis les redemande un par un
+        invalid = [i for i, pair in enumerate(pairs, 1) if pair is None]
+        if invalid:
+            DisplayMessage.display_invalid_score_indexes(invalid)
+            for i in invalid:
+                pairs[i - 1] = self._ask_match_score(rnd.matches[i - 1])
+
+        # 4️⃣ Construit results et recap dans le même format que la saisie par match
+        return self._build_score_lists(rnd, num, pairs)
+
+    # ------- Construction des listes results / recap d'un round -------
+    @staticmethod
+    def _build_score_lists(rnd, num, pairs):
+        """
+        Construit, à partir des couples de points saisis (un par match) :
+        - results : tuples (index round, index match, score1, score2) pour record_results
+        - recap   : tuples (joueur1, joueur2, score1, score2) pour l'affichage
+        Les deux listes sont produites par compréhension, à leur taille finale.
+        """
+        r_idx = num - 1
+        results = [(r_idx, i, a, b) for i, (a, b) in enumerate(pairs)]
+        recap = [(m.p1, m.p2, a, b) for m, (a, b) in zip(rnd.matches, pairs)]
         return results, recap
 
     # ------- Demande et valide la saisie du score pour un match -------
@@ -417,24 +469,21 @@ class TournamentRound(TournamentRoundController):
         - 0.5-0.5 (match nul)
         Retourne un tuple (score_joueur1, score_joueur2) sous forme de float.
         """
-        # 1️⃣ Récupère les deux joueurs du match
-        p1, p2 = match.players
+        # 1️⃣ Prépare une seule fois tout ce que la boucle réutilise :
+        #    invite de saisie, table des scores, table des blancs
+        p1, p2 = match.p1, match.p2
+        prompt = f"{p1.full_name}[{p1.national_id}] VS {p2.full_name}[{p2.national_id}] : "
+        scores = SCORE_MAP
+        blanks = WHITESPACE
 
         # 2️⃣ Boucle jusqu'à obtenir un score valide
         while True:
             # 🅰 Demande la saisie du score
-            s = (
-                input(
-                    f"{p1.last_name} {p1.first_name}[{p1.national_id}] VS "
-                    f"{p2.last_name} {p2.first_name}[{p2.national_id}] : "
-                )
-                .strip()
-                .replace(" ", "")
-            )
-
-            # 🅱 Vérifie que la saisie correspond à l'un des formats valides
-            if s in ("1-0", "0-1", "0.5-0.5"):
-                return map(float, s.split("-"))
+            pair = scores.get(input(prompt).translate(blanks))
+
+            # 🅱 Retourne le couple de points si le format est valide
+            if pair is not None:
+                return pair
 
             # 🅲 Affiche un message d'erreur si le format est incorrect
             DisplayMessage.display_tournament_scores_example()
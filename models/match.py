@@ -2,6 +2,8 @@
 Représente un match entre deux joueurs et leurs scores.
 """
 
+from models.player import Player
+
 # -----------------------
 #   CLASSE MATCH
 # -----------------------
@@ -10,26 +12,54 @@ Représente un match entre deux joueurs et leurs scores.
 class Match:
     """Représente un match entre deux joueurs et leurs scores."""
 
+    # Attributs fixes : pas de __dict__ par instance (objets nombreux)
+    # Joueurs et scores sont stockés à plat (p1, p2, s1, s2), sans tuple
+    __slots__ = ("p1", "p2", "_s1", "_s2", "_serialized")
+
     def __init__(self, player1, player2, score1=0.0, score2=0.0):
-        # 1️⃣ Stocke toujours les deux joueurs ensemble
-        #    self.players est un tuple (joueur1, joueur2)
-        self.players = (player1, player2)
-        # 2️⃣ Stocke toujours les deux scores ensemble
-        #    self.scores est un tuple (score1, score2)
-        self.scores = (score1, score2)
+        # 1️⃣ Stocke les deux joueurs
+        self.p1 = player1
+        self.p2 = player2
+        # 2️⃣ Stocke les deux scores (et initialise la sérialisation mémorisée)
+        self.set_scores(score1, score2)
+
+    # ------- Scores du match (invalident la sérialisation mémorisée) -------
+    @property
+    def s1(self):
+        """Score du premier joueur."""
+        return self._s1
+
+    @property
+    def s2(self):
+        """Score du second joueur."""
+        return self._s2
+
+    def set_scores(self, score1, score2):
+        """Modifie les deux scores et oublie la sérialisation mémorisée."""
+        self._s1 = score1
+        self._s2 = score2
+        self._serialized = None
 
     # -----------------------
     #   SÉRIALISATION DU MATCH
     # -----------------------
 
     def serialize(self):
-        """Prépare ce match pour l'enregistrer en JSON."""
-        # 3️⃣ On récupère les joueurs et leurs scores
-        p1, p2 = self.players
-        s1, s2 = self.scores
-        # 4️⃣ On renvoie un tuple de deux tuples :
+        """
+        Prépare ce match pour l'enregistrer en JSON.
+        Le résultat est mémorisé jusqu'au prochain changement de scores
+        ou du registre des joueurs (un identifiant a pu être modifié).
+        """
+        # 3️⃣ Réutilise le résultat mémorisé s'il est encore valable
+        cached = self._serialized
+        if cached is not None and cached[0] == Player.registry_version:
+            return cached[1]
+
+        # 4️⃣ On construit un tuple de deux tuples :
         #    - chaque sous-tuple contient (ID du joueur, son score)
-        return (
-            (p1.national_id, s1),
-            (p2.national_id, s2),
+        data = (
+            (self.p1.national_id, self._s1),
+            (self.p2.national_id, self._s2),
         )
+        self._serialized = (Player.registry_version, data)
+        return data
@@ -3,6 +3,9 @@ Représente un joueur et garde la liste de tous les joueurs.
 """
 
 import json
+import os
+import sys
+from operator import attrgetter
 from pathlib import Path
 
 # 1️⃣ Définition du chemin du fichier JSON contenant les données des joueurs
@@ -26,13 +29,39 @@ class Player:
       - Stocker les informations personnelles d'un joueur
       (nom, prénom, date de naissance, identifiant national)
       - Normaliser les données saisies (majuscules pour le nom et l'ID, capitalisation du prénom)
+      - Tenir à jour une clé de tri sort_key = (nom, prénom) et les libellés
+      d'affichage full_name ("NOM Prénom") et label ("NOM Prénom [ID]"),
+      recalculés à chaque changement de nom, de prénom ou d'identifiant
       - Conserver une liste globale (registry) contenant tous les joueurs créés
+      et un index by_id {identifiant national: joueur}, tenu à jour avec national_id
       - Initialiser le score (points) à zéro
     """
 
+    # Attributs d'instance fixes : pas de __dict__ par joueur
+    # (nom, prénom et identifiant sont stockés derrière leurs propriétés)
+    __slots__ = (
+        "_last_name",
+        "_first_name",
+        "_national_id",
+        "sort_key",
+        "full_name",
+        "label",
+        "birth_date",
+        "points",
+    )
+
     # 1️⃣ Liste globale qui conserve tous les joueurs instanciés
     registry = []
 
+    # 🅰 Index des joueurs du registre par identifiant national
+    by_id = {}
+
+    # 🅱 Version du registre : changée à chaque ajout, retrait ou renommage
+    registry_version = 0
+
+    # 🅲 Registre trié mémorisé : (version, liste triée) ou None
+    _sorted_cache = None
+
     # ------- Initialisation d'un nouvel objet joueur -------
     def __init__(self, last_name, first_name, birth_date, national_id):
         """
@@ -49,8 +78,12 @@ class Player:
         #    - Nom : majuscules
         #    - Prénom : première lettre en majuscule
         #    - ID national : majuscules
-        self.last_name = last_name.upper()
-        self.first_name = first_name.capitalize()
+        #    La clé de tri et les libellés sont calculés une fois ici
+        #    (le setter de national_id complète le libellé avec l'ID)
+        self._last_name = last_name.upper()
+        self._first_name = first_name.capitalize()
+        self.sort_key = (self._last_name, self._first_name)
+        self.full_name = f"{self._last_name} {self._first_name}"
         self.birth_date = birth_date
         self.national_id = national_id.upper()
 
@@ -60,6 +93,93 @@ class Player:
         # 4️⃣ Ajoute le joueur créé dans la liste globale registry
         #    Cela permet d'accéder à tous les joueurs sans base de données
         Player.registry.append(self)
+        Player.registry_changed()
+
+    # ------- Identifiant national, tenu à jour dans l'index by_id -------
+    @property
+    def national_id(self):
+        """Identifiant national du joueur."""
+        return self._national_id
+
+    @national_id.setter
+    def national_id(self, value):
+        """
+        Modifie l'identifiant et déplace le joueur dans l'index by_id.
+        L'identifiant est internalisé (sys.intern) : une seule chaîne partagée
+        par identifiant, comparée par adresse dans la plupart des cas.
+        Un changement d'identifiant change la version du registre, ce qui
+        invalide les sérialisations mémorisées (Match.serialize).
+        """
+        value = sys.intern(value)
+        old = getattr(self, "_national_id", None)
+        if Player.by_id.get(old) is self:
+            del Player.by_id[old]
+        self._national_id = value
+        Player.by_id[value] = self
+        self.label = f"{self.full_name} [{value}]"
+
+        # Identifiant réellement modifié (pas la première affectation du constructeur)
+        if old is not None and old != value:
+            Player.registry_changed()
+
+    # ------- Nom, prénom et clé de tri associée -------
+    @property
+    def last_name(self):
+        """Nom de famille du joueur."""
+        return self._last_name
+
+    @last_name.setter
+    def last_name(self, value):
+        """Modifie le nom et recalcule la clé de tri et les libellés."""
+        self._last_name = value
+        self._refresh_name_keys()
+
+    @property
+    def first_name(self):
+        """Prénom du joueur."""
+        return self._first_name
+
+    @first_name.setter
+    def first_name(self, value):
+        """Modifie le prénom et recalcule la clé de tri et les libellés."""
+        self._first_name = value
+        self._refresh_name_keys()
+
+    def _refresh_name_keys(self):
+        """Recalcule sort_key, full_name et label après un changement de nom."""
+        self.sort_key = (self._last_name, self._first_name)
+        self.full_name = f"{self._last_name} {self._first_name}"
+        self.label = f"{self.full_name} [{self._national_id}]"
+
+    # -----------------------
+    #   REGISTRE TRIÉ
+    # -----------------------
+
+    # ------- Signale une modification du registre -------
+    @classmethod
+    def registry_changed(cls):
+        """
+        Change la version du registre pour invalider le tri mémorisé.
+        À appeler après un retrait ou un changement de nom/prénom
+        (le setter de national_id l'appelle lui-même).
+        """
+        cls.registry_version += 1
+
+    # ------- Registre trié par nom puis prénom (mémorisé) -------
+    @classmethod
+    def sorted_registry(cls):
+        """
+        Retourne les joueurs du registre triés par nom puis prénom.
+        - Le tri n'est refait que si le registre a changé depuis le dernier appel.
+        - La liste retournée est partagée : ne pas la modifier.
+        """
+        # 1️⃣ Cache absent ou périmé : on trie à nouveau
+        if cls._sorted_cache is None or cls._sorted_cache[0] != cls.registry_version:
+            ordered = sorted(cls.registry, key=attrgetter("sort_key"))
+            cls._sorted_cache = (cls.registry_version, ordered)
+
+        # 2️⃣ Retourne la liste triée mémorisée
+        return cls._sorted_cache[1]
 
     # -----------------------
     #   CHARGEMENT DES JOUEURS
@@ -80,6 +200,8 @@ class Player:
         """
         # 1️⃣ Réinitialisation de la liste des joueurs déjà en mémoire
         cls.registry.clear()
+        cls.by_id.clear()
+        cls.registry_changed()
 
         # 2️⃣ Si aucun fichier de sauvegarde n'existe, retourne une liste vide
         if not DATA_FILE.exists():
@@ -131,25 +253,28 @@ class Player:
         DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
 
         # 2️⃣ Préparer une liste simple de dictionnaires à partir de Player.registry
-        simple_list = []
-        for p in cls.registry:
-            # 🅰 On prend uniquement les attributs de base (pas les objets)
-            simple_list.append(
-                {
-                    "last_name": p.last_name,
-                    "first_name": p.first_name,
-                    "birth_date": p.birth_date,
-                    "national_id": p.national_id,
-                    "points": p.points,
-                }
-            )
+        #    (uniquement les attributs de base, pas les objets)
+        simple_list = [
+            {
+                "last_name": p.last_name,
+                "first_name": p.first_name,
+                "birth_date": p.birth_date,
+                "national_id": p.national_id,
+                "points": p.points,
+            }
+            for p in cls.registry
+        ]
 
         # 3️⃣ Sauvegarder cette liste dans le fichier JSON
+        #    Le texte est encodé en une fois par json.dumps puis écrit en une
+        #    seule écriture (json.dump écrirait fragment par fragment)
+        #    dans un fichier temporaire, remplacé atomiquement par os.replace :
+        #    une interruption ne laisse jamais un players.json tronqué
+        text = json.dumps(simple_list, indent=4, ensure_ascii=False)
+        tmp = DATA_FILE.with_name(DATA_FILE.name + ".tmp")
         try:
-            # 🅰 Ouvrir le fichier en écriture (création si nécessaire)
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                # 🅱 Convertir la liste en JSON
-                json.dump(simple_list, f, indent=4, ensure_ascii=False)
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, DATA_FILE)
         except OSError:
             # 🅲 Si problème d'accès ou d'écriture, afficher un message d'erreur
             print("❌ Impossible d'écrire dans players.json")
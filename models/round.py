@@ -19,6 +19,9 @@ class Round:
       - Permet de regrouper les matchs par manche dans un tournoi
     """
 
+    # Attributs fixes : pas de __dict__ par instance
+    __slots__ = ("name", "matches", "start_time", "end_time")
+
     # ------- Initialisation d'un nouvel objet Round -------
     def __init__(self, name, matches=None):
         """
@@ -46,6 +49,22 @@ class Round:
         #    - Elle sera définie plus tard quand le round sera clôturé
         self.end_time = None
 
+    # ------- Reconstruction d'un round enregistré -------
+    @classmethod
+    def restore(cls, name, matches, start_time, end_time):
+        """
+        Recrée un round lu depuis un fichier JSON, avec ses horaires d'origine.
+
+        Contrairement à Round(), n'interroge pas l'horloge : les horaires
+        enregistrés sont repris tels quels (éventuellement None).
+        """
+        rnd = cls.__new__(cls)
+        rnd.name = name
+        rnd.matches = matches
+        rnd.start_time = start_time
+        rnd.end_time = end_time
+        return rnd
+
     # -----------------------
     #   CLÔTURE DU ROUND
     # -----------------------
@@ -2,8 +2,13 @@
 Représente un tournoi d'échecs (système suisse simple).
 """
 
+import hashlib
 import json
+import os
 import random
+from collections import deque
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from models.player import Player
 from models.round import Round
@@ -12,6 +17,19 @@ from models.match import Match
 # Répertoire de sauvegarde des tournois
 DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "tournaments"
 
+# Clé de tri / de regroupement des joueurs par points
+POINTS = attrgetter("points")
+
+
+# ------- Nom de fichier JSON dérivé du nom d'un tournoi -------
+def _slug(name):
+    """
+    Retourne le nom de fichier JSON d'un tournoi :
+    tout en minuscules, espaces remplacés par "_", extension .json.
+    """
+    return name.lower().replace(" ", "_") + ".json"
+
+
 # -----------------------
 #   INITIALISATION DU TOURNOI
 # -----------------------
@@ -23,6 +41,7 @@ class Tournament:
 
     Attributs :
         - name           : Nom du tournoi
+        - name_key       : Nom normalisé (casefold) pour les tris, tenu à jour avec name
         - place          : Lieu où se déroule le tournoi
         - start_date     : Date de début ("jj/mm/aaaa")
         - end_date       : Date de fin ("jj/mm/aaaa")
@@ -33,6 +52,7 @@ class Tournament:
         - players        : Liste des joueurs inscrits (objets Player)
         - rounds         : Liste des rounds joués (objets Round)
         - history        : Historique des matchs (tuples d'ID de joueurs)
+        - source_path    : Fichier JSON où le tournoi est enregistré (None avant la 1re sauvegarde)
     """
 
     # ------- Initialisation d'un nouvel objet tournoi -------
@@ -64,6 +84,36 @@ class Tournament:
         #    Chaque élément est un tuple (ID_joueur1, ID_joueur2)
         self.history = []
 
+        # 🅰 Mêmes appariements sous forme d'ensemble de frozensets {ID1, ID2} :
+        #    test « déjà joué ? » en O(1), quel que soit l'ordre des joueurs
+        self._met = set()
+
+        # 5️⃣ Fichier JSON associé (connu après chargement ou sauvegarde)
+        #    Permet de retrouver l'ancien fichier si le tournoi est renommé
+        self.source_path = None
+
+        # 6️⃣ Empreinte du dernier contenu écrit (None = jamais sauvegardé ici)
+        #    Permet d'éviter de réécrire un fichier identique
+        self._saved_digest = None
+
+    # ------- Nom du tournoi et clé de tri associée -------
+    @property
+    def name(self):
+        """Nom du tournoi."""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Modifie le nom du tournoi et recalcule sa clé de tri.
+        - name_key est calculée une seule fois ici (casefold = minuscules Unicode)
+          au lieu de l'être à chaque comparaison pendant un tri.
+        - Le chemin du fichier JSON mémorisé par _file_path() est oublié.
+        """
+        self._name = value
+        self.name_key = value.casefold()
+        self._cached_path = None
+
     # -----------------------
     #   APPARIEMENT DES JOUEURS
     # -----------------------
@@ -122,7 +172,7 @@ class Tournament:
         else:
             # 2️⃣ Rounds suivants : tri par points décroissants
             print("  • Étape 2: rounds suivants → tri par points")
-            self.players.sort(key=lambda p: p.points, reverse=True)
+            self.players.sort(key=POINTS, reverse=True)
             # Puis mélange des groupes de points égaux
             self._shuffle_equal_points_groups()
 
@@ -131,50 +181,46 @@ class Tournament:
         """
         Mélange aléatoirement les sous-groupes de joueurs ayant le même nombre de points.
         """
-        # 1️⃣ Parcourt la liste des joueurs et identifie les groupes par points
-        i = 0
-        while i < len(self.players):
-            j = i + 1
-            while (
-                j < len(self.players)
-                and self.players[j].points == self.players[i].points
-            ):
-                j += 1
-
-            # 2️⃣ Mélange le sous-groupe et le réinjecte dans la liste principale
-            subset = self.players[i:j]
+        # 1️⃣ Découpe la liste (déjà triée) en groupes de points égaux en une passe
+        #    et mélange chaque groupe, dans l'ordre de la liste
+        ordered = []
+        for _, group in groupby(self.players, key=POINTS):
+            subset = list(group)
             random.shuffle(subset)
-            self.players[i:j] = subset
+            ordered.extend(subset)
 
-            # 3️⃣ Passe au groupe suivant
-            i = j
+        # 2️⃣ Remplace le contenu de la liste principale en une seule affectation
+        self.players[:] = ordered
 
     # ------- Construction des appariements pour un round -------
     def _build_pairs(self):
         """
         Construit la liste des paires de joueurs pour ce round.
         Étapes :
-        1. Travaille sur une copie de la liste des joueurs restants.
+        1. Travaille sur une copie (deque) de la liste des joueurs restants.
         2. Retire les joueurs un à un et leur trouve un partenaire disponible.
         3. Crée les objets Match et met à jour l'historique des appariements.
         4. Retourne la liste des paires.
         """
         print("  • Étape 3: construction des paires sans re-matchs")
 
-        # 1️⃣ Copie de la liste des joueurs pour travailler proprement
-        remaining = self.players[:]
+        # 1️⃣ Copie des joueurs dans une deque : retirer le premier est en O(1)
+        #    (list.pop(0) décalerait tous les joueurs restants à chaque paire)
+        remaining = deque(self.players)
         pairs = []
 
         # 2️⃣ Boucle tant qu'il reste des joueurs à apparier
         while remaining:
-            p1 = remaining.pop(0)
+            p1 = remaining.popleft()
             # Trouver l'indice du partenaire compatible
             partner_idx = self._find_partner_index(p1, remaining)
             # Retirer le partenaire et créer un match
-            p2 = remaining.pop(partner_idx)
+            p2 = remaining[partner_idx]
+            del remaining[partner_idx]
             pairs.append(Match(p1, p2))
             # Ajouter cet appariement à l'historique
             self.history.append((p1.national_id, p2.national_id))
+            self._met.add(frozenset((p1.national_id, p2.national_id)))
 
         return pairs
 
@@ -186,11 +232,12 @@ class Tournament:
         - Le duo (p1, p2) ne doit pas avoir déjà été rencontré dans l'historique.
         """
         # 1️⃣ Parcourt tous les joueurs restants
+        met = self._met
+        p1_id = p1.national_id
         for k, p2 in enumerate(remaining):
-            duo = (p1.national_id, p2.national_id)
-            duo_r = (p2.national_id, p1.national_id)
-            # 2️⃣ Vérifie si cette paire est nouvelle
-            if duo not in self.history and duo_r not in self.history:
+            # 2️⃣ Vérifie si cette paire est nouvelle (une recherche dans l'ensemble,
+            #    valable dans les deux sens)
+            if frozenset((p1_id, p2.national_id)) not in met:
                 return k
         # 3️⃣ Si aucun partenaire valide trouvé, prend le premier par défaut
         return 0
@@ -199,6 +246,32 @@ class Tournament:
     #   DÉMARRAGE ROUND SUIVANT
     # -----------------------
 
+    # ------- Vérifie si le round suivant peut être lancé -------
+    def can_start_next_round(self):
+        """
+        Indique en une seule passe si le round suivant peut démarrer.
+        Retour :
+        - tuple (ok, raison) :
+            (False, "finished")   → le tournoi est déjà terminé
+            (False, "open_round") → le dernier round n'est pas clôturé
+            (False, "max_rounds") → tous les rounds prévus ont été joués
+            (True, "")            → le round suivant peut être lancé
+        """
+        # 1️⃣ Tournoi déjà terminé
+        if self.status == "terminé":
+            return (False, "finished")
+
+        # 2️⃣ Dernier round encore en cours
+        if self.rounds and not self.rounds[-1].end_time:
+            return (False, "open_round")
+
+        # 3️⃣ Nombre de rounds prévu atteint
+        if self.current_round_index >= self.total_rounds:
+            return (False, "max_rounds")
+
+        # 4️⃣ Rien ne bloque le round suivant
+        return (True, "")
+
     def start_next_round(self):
         """
         Démarre le round suivant dans le tournoi.
@@ -257,10 +330,10 @@ class Tournament:
             # a) Récupère l'objet Match correspondant dans le bon round
             match = self.rounds[r_idx].matches[m_idx]
             # b) Stocke les scores dans le match
-            match.scores = (s1, s2)
+            match.set_scores(s1, s2)
             # c) Ajoute les points aux joueurs
-            match.players[0].points += s1
-            match.players[1].points += s2
+            match.p1.points += s1
+            match.p2.points += s2
 
         # 2️⃣ Clôture du round en cours
         #    - current_round_index pointe vers le prochain round à jouer,
@@ -290,11 +363,17 @@ class Tournament:
         ------
         Path : chemin du fichier JSON où sauvegarder/charger ce tournoi
         """
-        # 1️⃣ Normalise le nom du tournoi pour générer un nom de fichier sûr
-        filename = self.name.lower().replace(" ", "_") + ".json"
+        # 1️⃣ Chemin déjà calculé depuis le dernier changement de nom
+        if self._cached_path is not None:
+            return self._cached_path
+
+        # 2️⃣ Normalise le nom du tournoi pour générer un nom de fichier sûr
+        filename = _slug(self.name)
 
-        # 2️⃣ Construit le chemin complet en joignant DATA_DIR et le nom du fichier
-        return DATA_DIR / filename
+        # 3️⃣ Construit le chemin complet en joignant DATA_DIR et le nom du fichier,
+        #    puis le mémorise jusqu'au prochain renommage
+        self._cached_path = DATA_DIR / filename
+        return self._cached_path
 
     # -----------------------
     #   SAUVEGARDE DU TOURNOI
@@ -310,6 +389,9 @@ class Tournament:
         2. Prépare un dictionnaire Python représentant toutes les informations
         importantes du tournoi (joueurs, rounds, historique, etc.).
         3. Écrit ce dictionnaire dans un fichier JSON (lisible et encodé en UTF-8).
+            - Rien n'est écrit si le contenu est identique à la dernière
+              sauvegarde de ce fichier (empreinte blake2b du texte JSON)
+        4. Supprime l'ancien fichier si le nom du tournoi a changé.
         """
 
         # 1️⃣ Création (si nécessaire) du dossier de stockage
@@ -320,8 +402,24 @@ class Tournament:
         # 2️⃣ Préparation des données
         data = self._build_tournament_data()
 
-        # 3️⃣ Écriture dans le fichier
-        self._write_tournament_file(data)
+        # 3️⃣ Écriture dans le fichier, sauf si rien n'a changé depuis la
+        #    dernière sauvegarde (le mtime reste alors intact)
+        path = self._file_path()
+        text = json.dumps(data, indent=4, ensure_ascii=False)
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        if (
+            digest == self._saved_digest
+            and path == self.source_path
+            and path.exists()
+        ):
+            return
+        self._write_tournament_file(text, path)
+        self._saved_digest = digest
+
+        # 4️⃣ Si le tournoi a été renommé, supprime l'ancien fichier devenu orphelin
+        if self.source_path is not None and self.source_path != path:
+            self.source_path.unlink(missing_ok=True)
+        self.source_path = path
 
     # ------- Construction du dictionnaire de données du tournoi -------
     def _build_tournament_data(self):
@@ -359,15 +457,17 @@ class Tournament:
         }
 
     # ------- Écriture des données du tournoi dans un fichier JSON -------
-    def _write_tournament_file(self, data):
+    def _write_tournament_file(self, text, path):
         """
-        Écrit les données d'un tournoi dans un fichier JSON lisible.
+        Écrit le texte JSON d'un tournoi dans le fichier `path`.
 
-        - indent=4 pour rendre lisible
-        - ensure_ascii=False pour conserver les accents
+        - Le texte est produit par save() (indent=4, ensure_ascii=False)
+        - Écriture atomique : fichier temporaire puis os.replace, pour ne
+          jamais laisser un JSON tronqué en cas d'interruption
         """
-        with open(self._file_path(), "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
 
     # -----------------------
     #   CHARGEMENT D'UN TOURNOI
@@ -409,6 +509,9 @@ class Tournament:
         # 5️⃣ Restaurer l'historique et recalculer les points
         cls._restore_history_and_points(raw, tournament)
 
+        # 6️⃣ Mémorise le fichier d'origine (utile pour renommer ou supprimer)
+        tournament.source_path = DATA_DIR / filename
+
         return tournament
 
     # ------- Lecture brute des données JSON d'un tournoi -------
@@ -498,9 +601,9 @@ class Tournament:
         #    (cela permet de retrouver les instances déjà existantes)
         Player.load_all()
 
-        # 2️⃣ Créer un dictionnaire {ID national → instance Player}
+        # 2️⃣ Dictionnaire {ID national → instance Player} tenu à jour par Player
         #    pour un accès rapide aux objets joueurs via leur identifiant unique
-        id_map = {p.national_id: p for p in Player.registry}
+        id_map = Player.by_id
 
         # 3️⃣ Associer les joueurs listés dans raw["players"] au tournoi
         #    en utilisant le dictionnaire id_map
@@ -542,14 +645,14 @@ class Tournament:
                 # Création d'un objet Match avec joueurs et scores restaurés
                 matches.append(Match(p1, p2, score1=s1, score2=s2))
 
-            # 3️⃣ Création du Round avec son nom et ses matchs
-            rnd = Round(name=r["name"], matches=matches)
-
-            # 4️⃣ Restauration des horaires (début et fin) s'ils sont présents
-            rnd.start_time = r.get("start_time")
-            rnd.end_time = r.get("end_time")
+            # 3️⃣ Création du Round avec son nom, ses matchs et ses horaires
+            #    enregistrés (début et fin, None s'ils sont absents) ;
+            #    Round.restore n'appelle pas datetime.now() inutilement
+            rnd = Round.restore(
+                r["name"], matches, r.get("start_time"), r.get("end_time")
+            )
 
-            # 5️⃣ Ajout du round reconstruit à la liste des rounds du tournoi
+            # 4️⃣ Ajout du round reconstruit à la liste des rounds du tournoi
             tournament.rounds.append(rnd)
 
     # ------- Restauration de l’historique et recalcul des points -------
@@ -569,7 +672,10 @@ class Tournament:
         """
 
         # 1️⃣ Restaure la liste des appariements déjà effectués
+        #    (le JSON les relit sous forme de listes [ID1, ID2])
+        #    et reconstruit l'ensemble utilisé pour les tests d'appariement
         tournament.history = raw.get("history", [])
+        tournament._met = {frozenset(pair) for pair in tournament.history}
 
         # 2️⃣ Recalcule les points en fonction des scores enregistrés
         tournament.recalculate_points()
@@ -583,22 +689,24 @@ class Tournament:
         Recalcule les points des joueurs en fonction de tous les matchs joués.
 
         Étapes :
-        1. Remet à zéro les points de tous les joueurs inscrits au tournoi.
-        2. Parcourt chaque round et chaque match pour additionner les scores.
-        3. Met à jour les points cumulés dans chaque objet Player.
+        1. Part de 0.0 point pour chaque joueur inscrit au tournoi.
+        2. Parcourt chaque round et chaque match pour additionner les scores
+           dans un dictionnaire local {joueur: total}.
+        3. Écrit une seule fois les points cumulés dans chaque objet Player.
         """
 
-        # 1️⃣ Réinitialise les points de tous les joueurs à 0.0
-        for p in self.players:
-            p.points = 0.0
+        # 1️⃣ Total de départ à 0.0 pour chaque joueur inscrit
+        totals = dict.fromkeys(self.players, 0.0)
+        get = totals.get
 
-        # 2️⃣ Pour chaque round déjà enregistré dans le tournoi
+        # 2️⃣ Pour chaque round déjà enregistré dans le tournoi,
+        #    puis chaque match joué dans ce round, cumule les scores
         for rnd in self.rounds:
-            # 3️⃣ Pour chaque match joué dans ce round
             for m in rnd.matches:
-                # Récupère les scores des deux joueurs
-                s1, s2 = m.scores
+                p1, p2 = m.p1, m.p2
+                totals[p1] = get(p1, 0.0) + m.s1
+                totals[p2] = get(p2, 0.0) + m.s2
 
-                # Ajoute les points aux joueurs correspondants
-                m.players[0].points += s1
-                m.players[1].points += s2
+        # 3️⃣ Met à jour les points cumulés (une écriture par joueur)
+        for p, points in totals.items():
+            p.points = points
@@ -5,12 +5,47 @@ Rôle :
   - Fournir des fonctions pour des saisies spécifiques (non vide, date)
 """
 
+import re
 from datetime import datetime
 from views.display_message import DisplayMessage
 
 # Nombre maximum de tentatives pour une saisie utilisateur
 MAX_ATTEMPTS = 3
 
+# Motif d'une date "jj/mm/aaaa" (jour et mois sur 1 ou 2 chiffres, comme strptime)
+DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+
+def is_valid_date(date_str):
+    """
+    Indique si la chaîne est une date valide au format jj/mm/aaaa.
+    Étapes :
+    1. Vérifie la forme avec l'expression régulière précompilée DATE_RE
+    2. Vérifie que le jour et le mois existent (ex. refuse 31/02/2025)
+    """
+    # 1️⃣ Forme générale : un simple parcours du motif, sans exception
+    match = DATE_RE.fullmatch(date_str)
+    if not match:
+        return False
+
+    # 2️⃣ Cohérence du calendrier : seul ce cas peut lever ValueError
+    day, month, year = map(int, match.groups())
+    try:
+        datetime(year, month, day)
+    except ValueError:
+        return False
+    return True
+
+
+def date_key(date_str):
+    """
+    Retourne une clé (année, mois, jour) comparable pour une date "jj/mm/aaaa"
+    déjà validée, sans passer par strptime ni créer d'objet datetime.
+    - Découpe sur "/" plutôt que par position : "1/2/2025" reste correct.
+    """
+    day, month, year = date_str.split("/")
+    return (int(year), int(month), int(day))
+
 
 class InputUtils:
     """
@@ -76,15 +111,14 @@ class InputUtils:
         while attempt < MAX_ATTEMPTS:
             # 🅰 Affiche le prompt et récupère la saisie utilisateur (supprime espaces inutiles)
             date_str = input(prompt_text).strip()
-            try:
-                # 🅱 Tente de convertir la saisie au format jj/mm/aaaa
-                datetime.strptime(date_str, "%d/%m/%Y")
-                # 🅲 Si la conversion réussit, retourne immédiatement la date saisie
+
+            # 🅱 Si la saisie respecte le format jj/mm/aaaa, on la retourne immédiatement
+            if is_valid_date(date_str):
                 return date_str
-            except ValueError:
-                # 🅳 Sinon, incrémente le compteur et affiche un message d'erreur
-                attempt += 1
-                DisplayMessage.display_input_date(attempt)
+
+            # 🅲 Sinon, incrémente le compteur et affiche un message d'erreur
+            attempt += 1
+            DisplayMessage.display_input_date(attempt)
 
         # 3️⃣ Si le nombre maximum de tentatives est atteint, on abandonne
         DisplayMessage.display_abort_operation()
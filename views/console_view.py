@@ -9,6 +9,8 @@ Ce module gère exclusivement l'affichage dans le terminal :
 Aucune logique métier ni traitement des données n'est effectuée ici.
 """
 
+from operator import attrgetter
+
 
 class ConsoleView:
     """
@@ -90,7 +92,7 @@ class ConsoleView:
         # 2️⃣ Trie la liste reçue par ordre alphabétique
         #    - d'abord par le nom (last_name)
         #    - puis par le prénom (first_name)
-        players_sorted = sorted(players, key=lambda p: (p.last_name, p.first_name))
+        players_sorted = sorted(players, key=attrgetter("sort_key"))
 
         # 3️⃣ Parcourt la liste triée et affiche chaque joueur avec un numéro
         for idx, p in enumerate(players_sorted, 1):
@@ -111,19 +113,36 @@ class ConsoleView:
         - tournaments (list) : liste d'objets Tournament à afficher.
 
         Affichage :
-        - Chaque ligne contient :
+        - Voir render_tournaments() pour le format de chaque ligne.
+        """
+        # 1️⃣ Construit le texte complet puis l'affiche en une seule fois
+        print(ConsoleView.render_tournaments(tournaments), end="")
+
+    @staticmethod
+    def render_tournaments(tournaments):
+        """
+        Construit le texte de la liste numérotée des tournois, sans l'afficher.
+
+        Paramètres :
+        - tournaments (list) : liste d'objets Tournament à afficher.
+
+        Retour :
+        - str : titre suivi d'une ligne par tournoi :
             numéro. Nom - Lieu - Date début → Date fin - Nb tours - Nb joueurs - Statut
         """
-        # 1️⃣ Affiche un titre clair avant la liste
-        print("\n--- Liste des tournois ---\n")
+        # 1️⃣ Titre clair avant la liste
+        lines = ["\n--- Liste des tournois ---\n"]
 
-        # 2️⃣ Parcourt la liste des tournois et affiche les informations clés pour chacun
+        # 2️⃣ Une ligne par tournoi avec ses informations clés
         for idx, t in enumerate(tournaments, 1):
-            print(
+            lines.append(
                 f"{idx}. {t.name} - {t.place} - {t.start_date} → {t.end_date} - "
                 f"{t.total_rounds} tours - {len(t.players)} joueurs - statut : {t.status}"
             )
 
+        # 3️⃣ Chaque ligne se termine par un retour à la ligne (comme print)
+        return "\n".join(lines) + "\n"
+
     # -----------------------
     #   AFFICHAGE DU CLASSEMENT
     # -----------------------
@@ -141,15 +160,19 @@ class ConsoleView:
         - Chaque ligne contient :
             rang. NOM Prénom - points pts
         """
-        # 1️⃣ Affiche un titre avec le nom du tournoi
-        print(f"\n=== Classement du tournoi : {tournament.name} ===")
+        # 1️⃣ Titre avec le nom du tournoi
+        lines = [f"\n=== Classement du tournoi : {tournament.name} ==="]
 
         # 2️⃣ Trie les joueurs par nombre de points décroissant
-        ordered = sorted(tournament.players, key=lambda p: p.points, reverse=True)
+        #    (tri stable en C sur attrgetter, sans lambda par joueur)
+        ordered = sorted(tournament.players, key=attrgetter("points"), reverse=True)
 
-        # 3️⃣ Affiche le classement avec rang, nom complet et points
-        for rank, p in enumerate(ordered, 1):
-            print(f"{rank}. {p.last_name} {p.first_name} - {p.points} pts")
+        # 3️⃣ Classement avec rang, nom complet et points, affiché en une écriture
+        lines.extend(
+            f"{rank}. {p.full_name} - {p.points} pts"
+            for rank, p in enumerate(ordered, 1)
+        )
+        print("\n".join(lines))
 
     # -----------------------
     #   AFFICHAGE D'UN ROUND
@@ -177,8 +200,8 @@ class ConsoleView:
 
         # 3️⃣ Parcourt et affiche chaque match de ce round
         for idx, m in enumerate(round_obj.matches, 1):
-            p1, p2 = m.players
-            s1, s2 = m.scores
+            p1, p2 = m.p1, m.p2
+            s1, s2 = m.s1, m.s2
             print(
-                f"{idx}. {p1.last_name} {p1.first_name} {s1} - {s2} {p2.last_name} {p2.first_name}"
+                f"{idx}. {p1.full_name} {s1} - {s2} {p2.full_name}"
             )
@@ -232,19 +232,21 @@ class DisplayMessage:
         )
 
     @staticmethod
-    def display_tournament_created_message():
-        """Affiche un message de confirmation de création d'un tournoi."""
-        print("\n✅  Tournoi créé avec succès !\n")
-
-    @staticmethod
-    def display_tournament_info_details(tournament):
-        """Affiche les détails d'un tournoi."""
-        print("--- Informations du tournoi créé ---\n")
-        print(f"Nom du tournoi       : {tournament.name}")
-        print(f"Lieu du tournoi      : {tournament.place}")
-        print(f"Date de début        : {tournament.start_date} → {tournament.end_date}")
-        print(f"Description          : {tournament.description}\n")
-        print(f"Nombre de tours      : {tournament.total_rounds}")
+    def render_tournament_created_message():
+        """Retourne le message de confirmation de création d'un tournoi."""
+        return "\n✅  Tournoi créé avec succès !\n\n"
+
+    @staticmethod
+    def render_tournament_info_details(tournament):
+        """Retourne le texte des détails d'un tournoi."""
+        return (
+            "--- Informations du tournoi créé ---\n\n"
+            f"Nom du tournoi       : {tournament.name}\n"
+            f"Lieu du tournoi      : {tournament.place}\n"
+            f"Date de début        : {tournament.start_date} → {tournament.end_date}\n"
+            f"Description          : {tournament.description}\n\n"
+            f"Nombre de tours      : {tournament.total_rounds}\n"
+        )
 
     # -----------------------
     #   MODIFICATION TOURNOI
@@ -255,23 +257,25 @@ class DisplayMessage:
         print("\n--- 🔄  Mise à jour des informations du tournoi ---\n")
 
     @staticmethod
-    def display_current_tournament_info(label="actuelles"):
-        """Affiche les informations actuelles d'un tournoi."""
-        print(f"\n🔍  Informations {label} du tournoi :\n")
+    def render_current_tournament_info(label="actuelles"):
+        """Retourne le titre des informations actuelles d'un tournoi."""
+        return f"\n🔍  Informations {label} du tournoi :\n\n"
 
     @staticmethod
-    def display_tournament_updated_details(tournament):
-        """Affiche les détails mis à jour d'un tournoi."""
-        print(f"Nom du tournoi       : {tournament.name}")
-        print(f"Lieu du tournoi      : {tournament.place}")
-        print(f"Date de début        : {tournament.start_date} → {tournament.end_date}")
-        print(f"Description          : {tournament.description}")
-        print(f"Nombre de tours      : {tournament.total_rounds}")
+    def render_tournament_updated_details(tournament):
+        """Retourne le texte des détails mis à jour d'un tournoi."""
+        return (
+            f"Nom du tournoi       : {tournament.name}\n"
+            f"Lieu du tournoi      : {tournament.place}\n"
+            f"Date de début        : {tournament.start_date} → {tournament.end_date}\n"
+            f"Description          : {tournament.description}\n"
+            f"Nombre de tours      : {tournament.total_rounds}\n"
+        )
 
     @staticmethod
-    def display_tournament_consigne():
-        """Affiche une consigne pour la mise à jour d'un tournoi."""
-        print("\nℹ️  Laisser vide pour conserver la valeur actuelle.\n")
+    def render_tournament_consigne():
+        """Retourne la consigne pour la mise à jour d'un tournoi."""
+        return "\nℹ️  Laisser vide pour conserver la valeur actuelle.\n\n"
 
     @staticmethod
     def display_tournament_end_date_error():
@@ -287,19 +291,9 @@ class DisplayMessage:
         )
 
     @staticmethod
-    def display_tournament_updated_message():
-        """Affiche un message de confirmation de mise à jour d'un tournoi."""
-        print("\n✅  Tournoi mis à jour avec succès !\n")
-
-    @staticmethod
-    def display_tournament_updated_info(tournament):
-        """Affiche les informations mises à jour d'un tournoi."""
-        print("--- Nouvelles infos du tournoi ---\n")
-        print(f"Nom du tournoi       : {tournament.name}")
-        print(f"Lieu du tournoi      : {tournament.place}")
-        print(f"Date de début        : {tournament.start_date} → {tournament.end_date}")
-        print(f"Description          : {tournament.description}")
-        print(f"Nombre de tours      : {tournament.total_rounds}\n")
+    def render_tournament_updated_message():
+        """Retourne le message de confirmation de mise à jour d'un tournoi."""
+        return "\n✅  Tournoi mis à jour avec succès !\n\n"
 
     # -----------------------
     #   SUPPRESSION TOURNOI
@@ -323,27 +317,31 @@ class DisplayMessage:
         print("\n--- 👥  Gestion des joueurs d'un tournoi ---")
 
     @staticmethod
-    def display_tournament_title():
-        """Affiche le titre visuel du tournoi."""
-        print("\n--- 🏆  Informations du tournoi ---\n")
+    def render_tournament_title():
+        """Retourne le titre visuel du tournoi."""
+        return "\n--- 🏆  Informations du tournoi ---\n\n"
 
     @staticmethod
-    def display_tournament_info(tournament):
-        """Affiche les informations détaillées d'un tournoi."""
-        print(f"Nom                : {tournament.name}")
-        print(f"Lieu               : {tournament.place}")
-        print(f"Dates              : {tournament.start_date} → {tournament.end_date}")
-        print(f"Description        : {tournament.description}")
-        print(f"Nombre de tours    : {tournament.total_rounds}")
-        print(f"Joueurs inscrits   : {len(tournament.players)}\n")
+    def render_tournament_info(tournament):
+        """Retourne le texte des informations détaillées d'un tournoi."""
+        return (
+            f"Nom                : {tournament.name}\n"
+            f"Lieu               : {tournament.place}\n"
+            f"Dates              : {tournament.start_date} → {tournament.end_date}\n"
+            f"Description        : {tournament.description}\n"
+            f"Nombre de tours    : {tournament.total_rounds}\n"
+            f"Joueurs inscrits   : {len(tournament.players)}\n\n"
+        )
 
     @staticmethod
-    def display_manage_players_menu():
-        """Affiche le menu de gestion des joueurs d'un tournoi."""
-        print("--- 👥  Menu de gestion des joueurs ---")
-        print("1. Ajouter  joueur(s)")
-        print("2. Retirer  joueur(s)")
-        print("0. Retour\n")
+    def render_manage_players_menu():
+        """Retourne le texte du menu de gestion des joueurs d'un tournoi."""
+        return (
+            "--- 👥  Menu de gestion des joueurs ---\n"
+            "1. Ajouter  joueur(s)\n"
+            "2. Retirer  joueur(s)\n"
+            "0. Retour\n\n"
+        )
 
     # -----------------------
     #   AJOUTER JOUEUR(S)
@@ -372,7 +370,7 @@ class DisplayMessage:
         """Affiche un message de confirmation d'ajout d'un joueur."""
         print("\n👤 Joueur(s) ajouté(s) :")
         for p in added:
-            print(f"- {p.last_name} {p.first_name} [{p.national_id}]")
+            print(f"- {p.label}")
 
     @staticmethod
     def display_player_not_added_players():
@@ -401,12 +399,19 @@ class DisplayMessage:
                 f"{i}. {p.last_name} {p.first_name} | {p.national_id} | {p.birth_date}"
             )
 
+    @staticmethod
+    def display_players_to_remove(to_remove):
+        """Affiche la liste numérotée des joueurs sélectionnés pour le retrait."""
+        print("\n--- Joueurs à retirer ---")
+        for i, p in enumerate(to_remove, 1):
+            print(f"{i}. {p.label}")
+
     @staticmethod
     def display_finalize_player_removal(removed):
         """Affiche un message de confirmation de la suppression des joueurs."""
         print("\n👤 Joueur(s) retiré(s) :")
         for p in removed:
-            print(f"- {p.last_name} {p.first_name} [{p.national_id}]")
+            print(f"- {p.label}")
 
     @staticmethod
     def display_player_not_removed():
@@ -468,20 +473,14 @@ class DisplayMessage:
         print("Aucun round disponible.")
 
     @staticmethod
-    def display_round_details(idx):
-        """Affiche les détails d'un round."""
-        print(f"\n🥊 Round {idx} :")
+    def render_round_details(idx):
+        """Retourne l'en-tête d'un round."""
+        return f"\n🥊 Round {idx} :\n"
 
     @staticmethod
-    def display_match_details(rnd):
-        """Affiche les détails d'un match."""
-        for m in rnd.matches:
-            p1, p2 = m.players
-            s1, s2 = m.scores
-            print(
-                f"{p1.last_name} {p1.first_name}[{p1.national_id}] "
-                f"{s1} - {s2} {p2.last_name} {p2.first_name}[{p2.national_id}]\n"
-            )
+    def render_match_line(name1, id1, s1, s2, name2, id2):
+        """Retourne la ligne d'un match : NOM Prénom[ID] s1 - s2 NOM Prénom[ID]."""
+        return f"{name1}[{id1}] {s1} - {s2} {name2}[{id2}]\n\n"
 
     @staticmethod
     def display_export_success(path):
@@ -541,14 +540,13 @@ class DisplayMessage:
         print(f"Nombre de rounds : {tournament.total_rounds}\n")
 
     @staticmethod
-    def display_round_matches(rnd):
-        """Affiche chaque match avec les deux joueurs."""
+    def render_round_matches(rnd):
+        """Retourne une ligne par match : NOM Prénom [ID] VS NOM Prénom [ID]."""
+        lines = []
         for m in rnd.matches:
-            p1, p2 = m.players
-            print(
-                f"{p1.last_name} {p1.first_name} [{p1.national_id}] VS "
-                f"{p2.last_name} {p2.first_name} [{p2.national_id}]"
-            )
+            p1, p2 = m.p1, m.p2
+            lines.append(f"{p1.label} VS {p2.label}\n")
+        return "".join(lines)
 
     @staticmethod
     def display_start_next_round_title():
@@ -606,14 +604,13 @@ class DisplayMessage:
 
     @staticmethod
     def display_round_recap(num, rnd):
-        """Affiche le récapitulatif d'un round."""
-        print(f"\n--- Récapitulatif du round {num} ---")
+        """Affiche le récapitulatif d'un round (en une seule écriture)."""
+        lines = [f"\n--- Récapitulatif du round {num} ---"]
         for m in rnd.matches:
-            p1, p2 = m.players
-            s1, s2 = m.scores
-            print(
-                f"{p1.last_name} {p1.first_name} {s1} - {s2} {p2.last_name} {p2.first_name}"
-            )
+            p1, p2 = m.p1, m.p2
+            s1, s2 = m.s1, m.s2
+            lines.append(f"{p1.full_name} {s1} - {s2} {p2.full_name}")
+        print("\n".join(lines))
 
     @staticmethod
     def display_tournament_consigne_title(tournament_name, num):
@@ -627,17 +624,38 @@ class DisplayMessage:
         """Affiche un exemple de saisie valide pour les scores."""
         print("❌ Exemple valide : 1-0, 0-1 ou 0.5-0.5")
 
+    @staticmethod
+    def display_numbered_round_matches(rnd):
+        """Affiche les matchs du round numérotés, pour une saisie groupée."""
+        lines = []
+        for i, m in enumerate(rnd.matches, 1):
+            p1, p2 = m.p1, m.p2
+            lines.append(
+                f"{i}. {p1.full_name}[{p1.national_id}] VS "
+                f"{p2.full_name}[{p2.national_id}]\n"
+            )
+        print("".join(lines), end="")
+
+    @staticmethod
+    def display_invalid_score_indexes(indexes):
+        """Affiche les numéros de matchs dont le score saisi est invalide."""
+        print(f"❌ Score manquant ou invalide pour le(s) match(s) : {', '.join(map(str, indexes))}")
+        print("💡 Ressaisissez uniquement ces scores (1-0, 0-1 ou 0.5-0.5).")
+
+    @staticmethod
+    def display_too_many_scores(count, expected):
+        """Affiche une erreur quand la ligne contient plus de scores que de matchs."""
+        print(f"❌ {count} scores saisis pour {expected} match(s). Ressaisissez la ligne complète.")
+
     @staticmethod
     def display_round_recap_summary(num, recap):
-        """Affiche le récapitulatif des scores d'un round."""
-        print(f"\n--- Récapitulatif du round {num} ---")
+        """Affiche le récapitulatif des scores d'un round (en une seule écriture)."""
+        lines = [f"\n--- Récapitulatif du round {num} ---"]
 
-        # 2️⃣ Parcourt la liste recap et affiche chaque score
+        # 2️⃣ Parcourt la liste recap et prépare une ligne par score
         for p1, p2, a, b in recap:
-            print(
-                f"{p1.last_name} {p1.first_name} {a} - {b} "
-                f"{p2.last_name} {p2.first_name}"
-            )
+            lines.append(f"{p1.full_name} {a} - {b} {p2.full_name}")
+        print("\n".join(lines))
 
     @staticmethod
     def display_scores_saved_message():